@@ -9,7 +9,8 @@ import sys
 
 filename = inspect.getfile(lambda: None)
 parent = os.path.dirname(filename)
-sys.path.insert(0, parent)
+if parent not in sys.path:
+    sys.path.insert(0, parent)
 from turbo_turtle_abaqus import _mixed_settings
 
 from abaqusGui import *
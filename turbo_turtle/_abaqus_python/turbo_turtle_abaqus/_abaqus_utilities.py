@@ -1,6 +1,5 @@
 import os
 import sys
-import shutil
 import inspect
 import tempfile
 
@@ -8,7 +7,8 @@ filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import _mixed_utilities
 
 
@@ -25,7 +25,7 @@ class AbaqusNamedTemporaryFile:
         import abaqus
 
         self.temporary_file = tempfile.NamedTemporaryFile(*args, delete=False, **kwargs)
-        shutil.copyfile(input_file, self.temporary_file.name)
+        _mixed_utilities.copyfile(input_file, self.temporary_file.name)
         abaqus.openMdb(pathName=self.temporary_file.name)
 
     def __enter__(self):
@@ -52,10 +52,8 @@ def return_abaqus_constant(search):
     import abaqusConstants
 
     search = search.upper()
-    attribute = None
-    if hasattr(abaqusConstants, search):
-        attribute = getattr(abaqusConstants, search)
-    else:
+    attribute = getattr(abaqusConstants, search, None)
+    if attribute is None:
         raise ValueError("The abaqusConstants module does not have a matching '{}' object".format(search))
     return attribute
 
@@ -130,13 +128,15 @@ def surface_from_mask(part, feature, name_mask):
     :raises ValueError: If feature is not one of 'faces' or 'edges'
     :raises RuntimeError: If Abaqus throws an empty sequence abaqus.AbaqusException on one or more masks
     """
-    attribute = getattr(part, feature)
+    import abaqus
+
     if feature == "faces":
         surface_keyword = "side1Faces"
     elif feature == "edges":
         surface_keyword = "side1Edges"
     else:
         raise ValueError("Feature must be one of: faces, edges")
+    attribute = getattr(part, feature)
     bad_masks = []
     for name, mask in name_mask:
         try:
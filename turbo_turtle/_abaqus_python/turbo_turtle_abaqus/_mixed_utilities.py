@@ -5,6 +5,7 @@ from __future__ import print_function
 import os
 import re
 import sys
+import shutil
 import functools
 
 import numpy
@@ -102,6 +103,9 @@ def return_genfromtxt(
 ):
     """Parse a text file of XY coordinates into a numpy array
 
+    Files are parsed with the compiled ``numpy.loadtxt`` reader. Files that ``numpy.loadtxt`` can not parse, e.g. files
+    with missing values, fall back to the slower ``numpy.genfromtxt`` reader.
+
     If the resulting numpy array doesn't have the specified dimensions or column count, return an error exit code
 
     :param str file_name: input text file with coordinates to draw
@@ -112,7 +116,11 @@ def return_genfromtxt(
     :rtype: numpy.array
     """
     with open(file_name, "r") as points_file:
-        coordinates = numpy.genfromtxt(points_file, delimiter=delimiter, skip_header=header_lines)
+        try:
+            coordinates = numpy.loadtxt(points_file, delimiter=delimiter, skiprows=header_lines)
+        except ValueError:
+            points_file.seek(0)
+            coordinates = numpy.genfromtxt(points_file, delimiter=delimiter, skip_header=header_lines)
     shape = coordinates.shape
     dimensions = len(shape)
     if expected_dimensions is not None and dimensions != expected_dimensions:
@@ -167,6 +175,91 @@ def intersection_of_lists(requested, available):
     return sorted(intersection)
 
 
+def float_list(string):
+    """Return a list of floats from a comma separated string, e.g. ``"0.0, 0.0, 0.0"`` or ``"[0.0, 0.0, 0.0]"``
+
+    :param str string: comma separated numbers with optional enclosing brackets or parentheses
+
+    :returns: list of floats
+    :rtype: list
+    """
+    return [float(item) for item in string.strip().strip("[]()").split(",")]
+
+
+#: Linux ``ioctl`` request code for a copy-on-write file clone
+FICLONE = 0x40049409
+
+
+def _clone_file(source, destination):
+    """Attempt a copy-on-write clone of the ``source`` file to ``destination``
+
+    A clone is a metadata-only copy on file systems with reflink support, e.g. btrfs and XFS. Other platforms and file
+    systems report failure so the caller can fall back to a byte copy.
+
+    :param str source: file to clone
+    :param str destination: file to write
+
+    :returns: True if the clone succeeded, False otherwise
+    :rtype: bool
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        try:
+            fcntl.ioctl(destination_file.fileno(), FICLONE, source_file.fileno())
+        except (IOError, OSError):
+            return False
+    return True
+
+
+def _same_file(source, destination):
+    """Return True if ``source`` and ``destination`` refer to the same existing file
+
+    Mirrors the ``shutil.copyfile`` same file check. Falls back to a normalized absolute path comparison where
+    ``os.path.samefile`` is unavailable, e.g. Python 2 on Windows.
+
+    :param str source: file to copy
+    :param str destination: file to write
+
+    :returns: True if the files are the same, False otherwise
+    :rtype: bool
+    """
+    if not os.path.exists(destination):
+        return False
+    try:
+        return os.path.samefile(source, destination)
+    except (AttributeError, OSError):
+        return os.path.normcase(os.path.abspath(source)) == os.path.normcase(os.path.abspath(destination))
+
+
+def copyfile(source, destination, length=16 * 1024 * 1024):
+    """Copy the ``source`` file contents to ``destination``
+
+    Prefer a copy-on-write clone when the file system supports it. Otherwise, Python 3 ``shutil.copyfile`` uses
+    platform fast-copy system calls. The Python 2 implementation performs a buffered read/write loop with a small 16 KiB
+    buffer, so large model databases are copied with ``shutil.copyfileobj`` and a larger buffer in Abaqus Python 2.
+
+    :param str source: file to copy
+    :param str destination: file to write
+    :param int length: Python 2 copy buffer size in bytes
+
+    :raises shutil.Error: if ``source`` and ``destination`` are the same file. Raised before ``destination`` is opened
+        for writing, so the source file contents are preserved.
+    """
+    if _same_file(source, destination):
+        same_file_error = getattr(shutil, "SameFileError", shutil.Error)
+        raise same_file_error("{!r} and {!r} are the same file".format(source, destination))
+    if _clone_file(source, destination):
+        return
+    if sys.version_info.major == 2:
+        with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+            shutil.copyfileobj(source_file, destination_file, length)
+    else:
+        shutil.copyfile(source, destination)
+
+
 def _element_type_regex(content, element_type):
     """Place element type in Abaqus element keywords. RegEx uses MULTILINE and IGNORECASE
 
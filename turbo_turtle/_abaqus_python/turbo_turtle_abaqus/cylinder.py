@@ -2,13 +2,12 @@ import os
 import sys
 import inspect
 
-import numpy
-
 filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import parsers
 from turbo_turtle_abaqus import vertices
 from turbo_turtle_abaqus import geometry
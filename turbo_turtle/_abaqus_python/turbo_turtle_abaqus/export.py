@@ -12,7 +12,8 @@ filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import parsers
 from turbo_turtle_abaqus import _mixed_utilities
 from turbo_turtle_abaqus import _abaqus_utilities
@@ -82,7 +83,7 @@ def _export_assembly(assembly_file, model_name, part_name):
         part_name = model.parts.keys()
     if len(assembly.instances.keys()) == 0:
         for new_instance in part_name:
-            part = abaqus.mdb.models[model_name].parts[new_instance]
+            part = model.parts[new_instance]
             assembly.Instance(name=new_instance, part=part, dependent=abaqusConstants.ON)
     model.keywordBlock.synchVersions()
     block = model.keywordBlock.sieBlocks
@@ -145,7 +146,7 @@ def export_mesh_file(
     model = abaqus.mdb.models[model_name]
     assembly = model.rootAssembly
     if len(assembly.instances.keys()) == 0:
-        part = abaqus.mdb.models[model_name].parts[part_name]
+        part = model.parts[part_name]
         assembly.Instance(name=part_name, part=part, dependent=abaqusConstants.ON)
 
     model.keywordBlock.synchVersions()
@@ -4,14 +4,12 @@ import os
 import sys
 import glob
 
-import numpy
-
-
 filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import parsers
 from turbo_turtle_abaqus import vertices
 from turbo_turtle_abaqus import _mixed_utilities
@@ -174,8 +172,8 @@ def draw_part_from_splines(
     or a 3D body of revolution about the global Y-axis using the sketch. A 2D part can be either axisymmetric or planar
     depending on the ``planar`` and ``revolution_angle`` parameters.
 
-    If ``planar`` is ``False`` and ``revolution_angle`` is equal (``numpy.isclose()``) to zero, this script will
-    attempt to create a 2D axisymmetric model.
+    If ``planar`` is ``False`` and ``revolution_angle`` is equal to zero, within the ``numpy.isclose()`` default
+    absolute tolerance, this script will attempt to create a 2D axisymmetric model.
 
     If ``planar`` is ``False`` and ``revolution_angle`` is **not** zero, this script will attempt to create a 3D body of
     revolution about the global Y-axis.
@@ -204,7 +202,8 @@ def draw_part_from_splines(
     revolution_direction = _abaqus_utilities.revolution_direction(revolution_angle)
     revolution_angle = abs(revolution_angle)
 
-    sketch = abaqus.mdb.models[model_name].ConstrainedSketch(name="__profile__", sheetSize=200.0)
+    model = abaqus.mdb.models[model_name]
+    sketch = model.ConstrainedSketch(name="__profile__", sheetSize=200.0)
     sketch.sketchOptions.setValues(viewStyle=abaqusConstants.AXISYM)
     sketch.setPrimaryObject(option=abaqusConstants.STANDALONE)
     sketch.ConstructionLine(point1=(0.0, -100.0), point2=(0.0, 100.0))
@@ -212,30 +211,31 @@ def draw_part_from_splines(
     sketch.ConstructionLine(point1=(0.0, 0.0), point2=(1.0, 0.0))
     sketch.FixedConstraint(entity=sketch.geometry[3])
 
+    sketch_spline = sketch.Spline
+    sketch_line = sketch.Line
     for spline in splines:
-        spline = tuple(map(tuple, spline))
-        sketch.Spline(points=spline)
-    for point1, point2 in lines:
-        point1 = tuple(point1)
-        point2 = tuple(point2)
-        sketch.Line(point1=point1, point2=point2)
+        spline = tuple(map(tuple, spline.tolist()))
+        sketch_spline(points=spline)
+    for line in lines:
+        point1, point2 = map(tuple, line.tolist())
+        sketch_line(point1=point1, point2=point2)
     if planar:
-        part = abaqus.mdb.models[model_name].Part(
+        part = model.Part(
             name=part_name, dimensionality=abaqusConstants.TWO_D_PLANAR, type=abaqusConstants.DEFORMABLE_BODY
         )
         part.BaseShell(sketch=sketch)
-    elif numpy.isclose(revolution_angle, 0.0):
-        part = abaqus.mdb.models[model_name].Part(
+    elif vertices.is_axisymmetric(revolution_angle):
+        part = model.Part(
             name=part_name, dimensionality=abaqusConstants.AXISYMMETRIC, type=abaqusConstants.DEFORMABLE_BODY
         )
         part.BaseShell(sketch=sketch)
     else:
-        part = abaqus.mdb.models[model_name].Part(
+        part = model.Part(
             name=part_name, dimensionality=abaqusConstants.THREE_D, type=abaqusConstants.DEFORMABLE_BODY
         )
         part.BaseSolidRevolve(sketch=sketch, angle=revolution_angle, flipRevolveDirection=revolution_direction)
     sketch.unsetPrimaryObject()
-    del abaqus.mdb.models[model_name].sketches["__profile__"]
+    del model.sketches["__profile__"]
 
 
 def _gui_get_inputs():
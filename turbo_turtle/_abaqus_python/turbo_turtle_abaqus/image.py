@@ -6,12 +6,12 @@ import argparse
 import tempfile
 import ast
 
-
 filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import parsers
 from turbo_turtle_abaqus import _mixed_utilities
 from turbo_turtle_abaqus import _abaqus_utilities
@@ -117,6 +117,7 @@ def image(
     import abaqus
     import abaqusConstants
 
+    viewport = abaqus.session.viewports["Viewport: 1"]
     output_file_stem, output_file_extension = os.path.splitext(output_file)
     output_file_extension = output_file_extension.lstrip(".")
     if part_name is None:
@@ -126,25 +127,23 @@ def image(
             for new_instance in model.parts.keys():
                 part = model.parts[new_instance]
                 assembly.Instance(name=new_instance, part=part, dependent=abaqusConstants.ON)
-        abaqus.session.viewports["Viewport: 1"].assemblyDisplay.setValues(
+        viewport.assemblyDisplay.setValues(
             optimizationTasks=abaqusConstants.OFF,
             geometricRestrictions=abaqusConstants.OFF,
             stopConditions=abaqusConstants.OFF,
         )
-        abaqus.session.viewports["Viewport: 1"].setValues(displayedObject=assembly)
+        viewport.setValues(displayedObject=assembly)
     else:
         part_object = abaqus.mdb.models[model_name].parts[part_name]
-        abaqus.session.viewports["Viewport: 1"].setValues(displayedObject=part_object)
-
-    abaqus.session.viewports["Viewport: 1"].view.rotate(
-        xAngle=x_angle, yAngle=y_angle, zAngle=z_angle, mode=abaqusConstants.MODEL
-    )
-    abaqus.session.viewports["Viewport: 1"].view.fitView()
-    abaqus.session.viewports["Viewport: 1"].enableMultipleColors()
-    abaqus.session.viewports["Viewport: 1"].setColor(initialColor="#BDBDBD")
-    cmap = abaqus.session.viewports["Viewport: 1"].colorMappings[color_map]
-    abaqus.session.viewports["Viewport: 1"].setColor(colorMapping=cmap)
-    abaqus.session.viewports["Viewport: 1"].disableMultipleColors()
+        viewport.setValues(displayedObject=part_object)
+
+    viewport.view.rotate(xAngle=x_angle, yAngle=y_angle, zAngle=z_angle, mode=abaqusConstants.MODEL)
+    viewport.view.fitView()
+    viewport.enableMultipleColors()
+    viewport.setColor(initialColor="#BDBDBD")
+    cmap = viewport.colorMappings[color_map]
+    viewport.setColor(colorMapping=cmap)
+    viewport.disableMultipleColors()
     abaqus.session.printOptions.setValues(vpDecorations=abaqusConstants.OFF)
     abaqus.session.pngOptions.setValues(imageSize=image_size)
 
@@ -156,7 +155,7 @@ def image(
     abaqus.session.printToFile(
         fileName=output_file_stem,
         format=output_format,
-        canvasObjects=(abaqus.session.viewports["Viewport: 1"],),
+        canvasObjects=(viewport,),
     )
 
 
@@ -65,6 +65,25 @@ def construct_prog(basename):
     return prog
 
 
+def _part_name_help(cubit=False, plural=False):
+    """Return the ``--part-name`` help string shared by the Abaqus/Cubit volume subcommand parsers
+
+    :param bool cubit: Include the Cubit specific help language when True
+    :param bool plural: Use the plural "name(s)" help language when True
+
+    :returns: part name help string
+    :rtype: str
+    """
+    suffix = "(s)" if plural else ""
+    part_name_help_cubit = ""
+    if cubit:
+        part_name_help_cubit = (
+            "or Cubit volume name{}. Cubit implementation converts hyphens to underscores for "
+            "ACIS compatibility. ".format(suffix)
+        )
+    return "Part name{} {}(default: %(default)s)".format(suffix, part_name_help_cubit)
+
+
 geometry_defaults = {
     "unit_conversion": 1.0,
     "planar": False,
@@ -97,12 +116,7 @@ def geometry_parser(basename="geometry.py", add_help=True, description=geometry_
     :returns: argparse parser
     :rtype: argparse.ArgumentParser
     """
-    part_name_help_cubit = ""
-    if cubit:
-        part_name_help_cubit = (
-            "or Cubit volume name(s). Cubit implementation converts hyphens to underscores for " "ACIS compatibility. "
-        )
-    part_name_help = "Part name(s) {}(default: %(default)s)".format(part_name_help_cubit)
+    part_name_help = _part_name_help(cubit=cubit, plural=True)
 
     parser = argparse.ArgumentParser(add_help=add_help, description=description, prog=construct_prog(basename))
 
@@ -226,12 +240,7 @@ def cylinder_parser(basename="cylinder.py", add_help=True, description=cylinder_
     :rtype: argparse.ArgumentParser
     """
 
-    part_name_help_cubit = ""
-    if cubit:
-        part_name_help_cubit = (
-            "or Cubit volume name. Cubit implementation converts hyphens to underscores for " "ACIS compatibility. "
-        )
-    part_name_help = "Part name {}(default: %(default)s)".format(part_name_help_cubit)
+    part_name_help = _part_name_help(cubit=cubit)
 
     parser = argparse.ArgumentParser(add_help=add_help, description=description, prog=construct_prog(basename))
 
@@ -318,12 +327,7 @@ def sphere_parser(basename="sphere.py", add_help=True, description=sphere_cli_de
     :rtype: argparse.ArgumentParser
     """
 
-    part_name_help_cubit = ""
-    if cubit:
-        part_name_help_cubit = (
-            "or Cubit volume name. Cubit implementation converts hyphens to underscores for " "ACIS compatibility. "
-        )
-    part_name_help = "Part name {}(default: %(default)s)".format(part_name_help_cubit)
+    part_name_help = _part_name_help(cubit=cubit)
 
     parser = argparse.ArgumentParser(add_help=add_help, description=description, prog=construct_prog(basename))
 
@@ -418,12 +422,7 @@ def partition_parser(basename="partition.py", add_help=True, description=partiti
     :rtype: argparse.ArgumentParser
     """
 
-    part_name_help_cubit = ""
-    if cubit:
-        part_name_help_cubit = (
-            "or Cubit volume name. Cubit implementation converts hyphens to underscores for " "ACIS compatibility. "
-        )
-    part_name_help = "Part name {}(default: %(default)s)".format(part_name_help_cubit)
+    part_name_help = _part_name_help(cubit=cubit)
 
     parser = argparse.ArgumentParser(add_help=add_help, description=description, prog=construct_prog(basename))
 
@@ -606,12 +605,7 @@ def mesh_parser(basename="mesh_module.py", add_help=True, description=mesh_cli_d
     :rtype: argparse.ArgumentParser
     """
 
-    part_name_help_cubit = ""
-    if cubit:
-        part_name_help_cubit = (
-            "or Cubit volume name. Cubit implementation converts hyphens to underscores for " "ACIS compatibility. "
-        )
-    part_name_help = "Part name {}(default: %(default)s)".format(part_name_help_cubit)
+    part_name_help = _part_name_help(cubit=cubit)
 
     element_type_help_cubit = ""
     if cubit:
@@ -764,12 +758,7 @@ def export_parser(basename="export.py", add_help=True, description=export_cli_de
     :returns: argparse parser
     :rtype: argparse.ArgumentParser
     """
-    part_name_help_cubit = ""
-    if cubit:
-        part_name_help_cubit = (
-            "or Cubit volume name(s). Cubit implementation converts hyphens to underscores for " "ACIS compatibility. "
-        )
-    part_name_help = "Part name(s) {}(default: %(default)s)".format(part_name_help_cubit)
+    part_name_help = _part_name_help(cubit=cubit, plural=True)
 
     parser = argparse.ArgumentParser(add_help=add_help, description=description, prog=construct_prog(basename))
 
@@ -1,4 +1,3 @@
-import ast
 import os
 import sys
 import math
@@ -15,11 +14,13 @@ filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import parsers
 from turbo_turtle_abaqus import vertices
 from turbo_turtle_abaqus import _abaqus_utilities
 from turbo_turtle_abaqus import _mixed_settings
+from turbo_turtle_abaqus import _mixed_utilities
 
 
 def main(
@@ -72,17 +73,19 @@ def datum_axis(center, vector, part):
     return part.datums[part.DatumAxisByTwoPoint(point1=tuple(center), point2=tuple(point)).id]
 
 
-def datum_plane(center, normal, part):
+def datum_plane(center, normal, part, axis=None):
     """Return an Abaqus DataPlane object by center and normal axis
 
     :param numpy.array center: center location of the plane
     :param numpy.array normal: plane normal vector
     :param abaqus.mdb.models[].parts[] part: Abaqus part object
+    :param DatumAxis axis: existing datum axis along ``normal``. If None, a new datum axis is created.
 
     :returns: Abaqus Datum Plane object
     :rtype: DatumPlane
     """
-    axis = datum_axis(center, normal, part)
+    if axis is None:
+        axis = datum_axis(center, normal, part)
     return part.datums[part.DatumPlaneByPointNormal(point=tuple(center), normal=axis).id]
 
 
@@ -133,7 +136,7 @@ def partition(center, xvector, zvector, model_name, part_name, big_number=parser
             partition_2d(model_name, current_part, center, big_number, sketch_vertex_pairs)
         else:
             partition_3d(model_name, current_part, center, xvector, yvector, zvector, sketch_vertex_pairs)
-        abaqus.mdb.models[model_name].parts[current_part].checkGeometry()
+        part.checkGeometry()
 
 
 def partition_3d(model_name, part_name, center, xvector, yvector, zvector, sketch_vertex_pairs):
@@ -160,13 +163,25 @@ def partition_3d(model_name, part_name, center, xvector, yvector, zvector, sketc
     # TODO: This depends on the :meth:`turbo_turtle._abaqus_python.turbo_turtle_abaqus.vertices.datum_planes` tuple
     # order. Find a way to programmatically calculate (or return) the paired positive sketch edge instead of hardcoding
     # the matching order.
-    positive_sketch_axis = (yvector, yvector, zvector, zvector, xvector, xvector)
+    # Positive sketch up-edges (y, y, z, z, x, x) as indices into the primary plane normals (z, x, y)
+    positive_sketch_axis_index = (2, 2, 0, 0, 1, 1)
 
     model = abaqus.mdb.models[model_name]
     part = model.parts[part_name]
 
-    # Create local coordinate system primary partition planes
-    partition_planes = [datum_plane(center, normal, part) for normal in plane_normals]
+    # Every partition operation below acts on cells. Skip the datum and sketch construction for cell-less parts, e.g.
+    # 3D shells, where every partition attempt would raise and be ignored. Do not cache ``part.cells`` across the
+    # partition loops because each successful partition replaces the part's cells.
+    if len(part.cells) == 0:
+        return
+
+    # Create local coordinate system primary partition planes. The primary plane normal axes are also the positive
+    # sketch up-edges below, so create them once instead of adding duplicate datum features.
+    primary_axes = [datum_axis(center, normal, part) for normal in plane_normals[0:3]]
+    partition_planes = [
+        datum_plane(center, normal, part, axis=axis) for normal, axis in zip(plane_normals[0:3], primary_axes)
+    ]
+    partition_planes += [datum_plane(center, normal, part) for normal in plane_normals[3:]]
 
     # Partition by three (3) local coordinate system x/y/z planes
     for plane in partition_planes[0:3]:
@@ -176,16 +191,17 @@ def partition_3d(model_name, part_name, center, xvector, yvector, zvector, sketc
             pass
 
     # Partition by sketch on the six (6) 45 degree planes
-    for edge, plane in zip(positive_sketch_axis, partition_planes[3:]):
-        axis = datum_axis(center, edge, part)
+    for axis_index, plane in zip(positive_sketch_axis_index, partition_planes[3:]):
+        axis = primary_axes[axis_index]
+        # The sketch transform depends only on the datum plane and axis features, which partitioning does not modify
+        transform = part.MakeSketchTransform(
+            sketchPlane=plane,
+            sketchUpEdge=axis,
+            sketchPlaneSide=abaqusConstants.SIDE1,
+            origin=center,
+        )
         # TODO: Move to a dedicated partition function
         for vertex_1, vertex_2 in sketch_vertex_pairs:
-            transform = part.MakeSketchTransform(
-                sketchPlane=plane,
-                sketchUpEdge=axis,
-                sketchPlaneSide=abaqusConstants.SIDE1,
-                origin=center,
-            )
             sketch = model.ConstrainedSketch(
                 name="__profile__",
                 sheetSize=91.45,
@@ -315,13 +331,13 @@ def _gui_get_inputs():
     if center is not None:  # Center will be None if the user hits the "cancel/esc" button
         if cp_parameters != fields[-1][-1]:
             cp_param = [x.replace("\n", "") for x in cp_parameters.split("\n")]
-            center = ast.literal_eval(cp_param[0].replace("Center: ", ""))
-            xvector = ast.literal_eval(cp_param[1].replace("X-Vector: ", ""))
-            zvector = ast.literal_eval(cp_param[2].replace("Z-Vector: ", ""))
+            center = _mixed_utilities.float_list(cp_param[0].replace("Center: ", ""))
+            xvector = _mixed_utilities.float_list(cp_param[1].replace("X-Vector: ", ""))
+            zvector = _mixed_utilities.float_list(cp_param[2].replace("Z-Vector: ", ""))
         else:
-            center = list(ast.literal_eval(center))
-            xvector = list(ast.literal_eval(xvector))
-            zvector = list(ast.literal_eval(zvector))
+            center = _mixed_utilities.float_list(center)
+            xvector = _mixed_utilities.float_list(xvector)
+            zvector = _mixed_utilities.float_list(zvector)
         print("\nPartitioning Parameters Entered By User:")
         print("----------------------------------------")
         print('Only copy the three lines below to use "Copy and Paste Parameters"\n')
@@ -4,14 +4,13 @@ import shutil
 import inspect
 import tempfile
 
-import numpy
-
 
 filename = inspect.getfile(lambda: None)
 basename = os.path.basename(filename)
 parent = os.path.dirname(filename)
 grandparent = os.path.dirname(parent)
-sys.path.insert(0, grandparent)
+if grandparent not in sys.path:
+    sys.path.insert(0, grandparent)
 from turbo_turtle_abaqus import parsers
 from turbo_turtle_abaqus import vertices
 from turbo_turtle_abaqus import _mixed_utilities
@@ -120,7 +119,7 @@ def sphere(
     inner_point1, inner_point2, outer_point1, outer_point2 = arc_points
 
     sketch = model.ConstrainedSketch(name="__profile__", sheetSize=200.0)
-    if numpy.allclose(inner_point1, center) and numpy.allclose(inner_point2, center):
+    if vertices.is_solid_sphere(inner_radius):
         inner_point1 = center
         inner_point2 = center
     else:
@@ -133,7 +132,7 @@ def sphere(
     centerline = sketch.ConstructionLine(point1=center, angle=90.0)
     sketch.assignCenterline(line=centerline)
 
-    if numpy.isclose(revolution_angle, 0.0):
+    if vertices.is_axisymmetric(revolution_angle):
         part = model.Part(
             name=part_name, dimensionality=abaqusConstants.AXISYMMETRIC, type=abaqusConstants.DEFORMABLE_BODY
         )
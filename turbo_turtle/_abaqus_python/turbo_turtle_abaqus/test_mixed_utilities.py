@@ -6,7 +6,9 @@
 
 import os
 import sys
+import shutil
 import inspect
+import tempfile
 import unittest
 
 filename = inspect.getfile(lambda: None)
@@ -66,6 +68,45 @@ class TestMixedUtilities(unittest.TestCase):
             intersection = _mixed_utilities.intersection_of_lists(requested, available)
             self.assertEqual(intersection, expected)
 
+    def test_copyfile(self):
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            source = os.path.join(temporary_directory, "source.cae")
+            destination = os.path.join(temporary_directory, "destination.cae")
+            contents = b"turbo-turtle" * 1000
+            with open(source, "wb") as source_file:
+                source_file.write(contents)
+            _mixed_utilities.copyfile(source, destination, length=64)
+            with open(destination, "rb") as destination_file:
+                self.assertEqual(destination_file.read(), contents)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+    def test_copyfile_same_file(self):
+        temporary_directory = tempfile.mkdtemp()
+        try:
+            source = os.path.join(temporary_directory, "source.cae")
+            contents = b"turbo-turtle"
+            with open(source, "wb") as source_file:
+                source_file.write(contents)
+            with self.assertRaises(shutil.Error):
+                _mixed_utilities.copyfile(source, source)
+            with open(source, "rb") as source_file:
+                self.assertEqual(source_file.read(), contents)
+        finally:
+            shutil.rmtree(temporary_directory)
+
+    def test_float_list(self):
+        tests = [
+            ("0.0, 1.0, 2.0", [0.0, 1.0, 2.0]),
+            ("[0.0, 1.0, 2.0]", [0.0, 1.0, 2.0]),
+            ("(0, 1, 2)", [0.0, 1.0, 2.0]),
+            (" 0.0,1.0 , 2.0 ", [0.0, 1.0, 2.0]),
+        ]
+        for string, expected in tests:
+            floats = _mixed_utilities.float_list(string)
+            self.assertEqual(floats, expected)
+
     def test_element_type_regex(self):
         tests = [
             (
@@ -63,3 +63,18 @@ class TestParsers(unittest.TestCase):
         for basename, expected_prog in tests:
             prog = parsers.construct_prog(basename)
             assert prog == expected_prog
+
+    def test_part_name_help(self):
+        cubit_help = "Cubit implementation converts hyphens to underscores for ACIS compatibility. "
+        tests = [
+            ({"cubit": False}, "Part name (default: %(default)s)"),
+            ({"cubit": False, "plural": True}, "Part name(s) (default: %(default)s)"),
+            ({"cubit": True}, "Part name or Cubit volume name. " + cubit_help + "(default: %(default)s)"),
+            (
+                {"cubit": True, "plural": True},
+                "Part name(s) or Cubit volume name(s). " + cubit_help + "(default: %(default)s)",
+            ),
+        ]
+        for kwargs, expected_help in tests:
+            part_name_help = parsers._part_name_help(**kwargs)
+            assert part_name_help == expected_help
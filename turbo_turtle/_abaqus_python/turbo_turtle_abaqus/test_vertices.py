@@ -33,29 +33,18 @@ class TestVertices(unittest.TestCase):
         ]
         for coordinates, expected, rtol, atol in tests:
             bools = vertices._compare_xy_values(coordinates, rtol=rtol, atol=atol)
-            assert bools == expected
+            assert numpy.array_equal(bools, expected)
 
     def test_compare_euclidean_distance(self):
         tests = [
             (numpy.array([[0, 0], [1, 0]]), 0.1, [False, True]),
             (numpy.array([[0, 0], [1, 0]]), 10.0, [False, False]),
             (numpy.array([[0, 0], [1, 0]]), 1.0, [False, False]),
+            (numpy.array([[0, 0], [0.5, 0], [0.5, 0]]), -1.0, [False, True, True]),
         ]
         for coordinates, euclidean_distance, expected in tests:
             bools = vertices._compare_euclidean_distance(coordinates, euclidean_distance)
-            assert bools == expected
-
-    def test_bool_via_or(self):
-        tests = [
-            ([True, True], [False, False], [True, True]),
-            ([False, False], [False, False], [False, False]),
-            ([True, True], [True, True], [True, True]),
-            ([True, False], [False, True], [True, True]),
-            ([False, True], [True, False], [True, True]),
-        ]
-        for bool_list_1, bool_list_2, expected in tests:
-            bools = vertices._bool_via_or(bool_list_1, bool_list_2)
-            assert bools == expected
+            assert numpy.array_equal(bools, expected)
 
     def test_break_coordinates(self):
         tests = [
@@ -273,6 +262,23 @@ class TestVertices(unittest.TestCase):
             new_coordinates = vertices.scale_and_offset_coordinates(coordinates, unit_conversion, y_offset)
             assert numpy.allclose(new_coordinates, expected)
 
+    def test_scale_and_offset_coordinates_no_copy(self):
+        coordinates = numpy.array([[0.0, 0.0], [1.0, 1.0]])
+        new_coordinates = vertices.scale_and_offset_coordinates(coordinates)
+        assert new_coordinates is coordinates
+
+    def test_scale_and_offset_coordinates_integer_input(self):
+        tests = [
+            (1, 0),
+            (2, 1),
+        ]
+        for unit_conversion, y_offset in tests:
+            coordinates = numpy.array([[0, 0], [1, 1]])
+            new_coordinates = vertices.scale_and_offset_coordinates(coordinates, unit_conversion, y_offset)
+            assert new_coordinates.dtype == float
+            assert new_coordinates is not coordinates
+            assert numpy.allclose(new_coordinates, coordinates * unit_conversion + [0, y_offset])
+
     def test_lines_and_splines(self):
         tests = [
             (
@@ -335,6 +341,17 @@ class TestVertices(unittest.TestCase):
                     ),
                 ],
             ),
+            (
+                numpy.array([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0], [6.0, 6.5]]),
+                2,
+                [
+                    numpy.array([[1.0, 1.0], [5.0, 5.0]]),
+                    numpy.array([[6.0, 6.5], [0.0, 0.0]]),
+                    numpy.array([[0.0, 0.0], [1.0, 1.0]]),
+                    numpy.array([[5.0, 5.0], [6.0, 6.5]]),
+                ],
+                [],
+            ),
         ]
         for coordinates, euclidean_distance, expected_lines, expected_splines in tests:
             lines, splines = vertices.lines_and_splines(coordinates, euclidean_distance)
@@ -471,6 +488,34 @@ class TestVertices(unittest.TestCase):
             for line, expected_line in zip(lines, expected):
                 assert numpy.allclose(line, expected_line)
 
+    def test_is_solid_sphere(self):
+        tests = [
+            ((0.0, 0.0), 0.0, 1.0, "both", True),
+            ((0.0, 1.0e4), 0.0, 1.0, "both", True),
+            ((0.0, 1.0e4), 1.0e-3, 1.0, "both", False),
+            ((0.0, 0.0), 1.0e-8, 1.0, "upper", True),
+            ((0.0, 0.0), 2.0e-8, 1.0, "upper", False),
+            ((0.0, 0.0), -0.5, 1.0, "lower", False),
+            ((0.0, 1.0), 0.5, 1.0, "both", False),
+        ]
+        for center, inner_radius, outer_radius, quadrant, expected in tests:
+            assert vertices.is_solid_sphere(inner_radius) == expected
+            inner_points = vertices.sphere(center, inner_radius, outer_radius, quadrant)[0:2]
+            on_center = numpy.allclose(inner_points, center, rtol=0.0, atol=1.0e-8)
+            assert on_center == expected
+
+    def test_is_axisymmetric(self):
+        tests = [
+            (0.0, True),
+            (1.0e-8, True),
+            (-1.0e-8, True),
+            (2.0e-8, False),
+            (360.0, False),
+        ]
+        for revolution_angle, expected in tests:
+            assert vertices.is_axisymmetric(revolution_angle) == expected
+            assert vertices.is_axisymmetric(revolution_angle) == numpy.isclose(revolution_angle, 0.0)
+
     def test_rectalinear_coordinates(self):
         number = math.sqrt(2.0**2 / 2.0)
         tests = [
@@ -503,6 +548,22 @@ class TestVertices(unittest.TestCase):
             normalized = vertices.normalize_vector(vector)
             assert numpy.allclose(normalized, expected)
 
+    def test_normalize_rows(self):
+        one_over_root_three = 1.0 / math.sqrt(3.0)
+        tests = [
+            (
+                numpy.array([[2.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 0.5]]),
+                numpy.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]),
+            ),
+            (
+                numpy.array([[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]]),
+                numpy.array([[one_over_root_three, one_over_root_three, one_over_root_three]] * 2),
+            ),
+        ]
+        for vectors, expected in tests:
+            normalized = vertices._normalize_rows(vectors)
+            assert numpy.allclose(normalized, expected)
+
     def test_midpoint_vector(self):
         tests = [
             ([1.0, 0, 0], [0, 1.0, 0], numpy.array([0.5, 0.5, 0.0])),
@@ -530,6 +591,7 @@ class TestVertices(unittest.TestCase):
             ((1.0, 1.0, 1.0), [(1.0, 1.0, 1.0), (1.0, 0.0, 0.0)], True),
             ((1.0, 0.0, 0.0), [(0.0, 0.0, 1.0), (0.0, 1.0, 0.0)], False),
             ((0.0, 1.0, 0.0), [(2.0, 0.0, 0.0), (0.0, 2.0, 0.0)], True),
+            ((0.0, 1.0, 0.0), [], False),
         ]
         for first, options, expected in tests:
             boolean = vertices.any_parallel(first, options)
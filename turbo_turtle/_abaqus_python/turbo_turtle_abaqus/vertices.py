@@ -5,6 +5,10 @@ import cmath
 
 import numpy
 
+#: Absolute tolerance for scalar zero checks. Matches the ``numpy.isclose`` default ``atol`` without the numpy ufunc
+#: overhead on Python scalars.
+ZERO_TOLERANCE = 1.0e-8
+
 
 def rectalinear_coordinates(radius_list, angle_list):
     """Calculate 2D rectalinear XY coordinates from 2D polar coordinates
@@ -47,8 +51,8 @@ def cylinder_lines(inner_radius, outer_radius, height, y_offset=0.0):
     :param float outer_radius: Outer radius of the cylinder
     :param float height: Height of the cylinder
 
-    :returns: list of line segment coordinate pairs
-    :rtype: list of (numpy.array, numpy.array) tuples
+    :returns: list of [2, 2] line segment arrays, one (x, y) coordinate pair per row
+    :rtype: list of numpy.array
     """
     coordinates = cylinder(inner_radius, outer_radius, height, y_offset=y_offset)
     euclidean_distance = min(inner_radius, height) / 2.0
@@ -86,16 +90,52 @@ def sphere(center, inner_radius, outer_radius, quadrant):
     return points
 
 
+def is_solid_sphere(inner_radius):
+    """Return True if the sphere inner radius is zero and the sphere has no hollow center
+
+    Compares the inner radius against :attr:`ZERO_TOLERANCE`. The decision depends only on the inner radius, not on the
+    :meth:`sphere` inner arc end points, so an offset sphere center does not scale the tolerance.
+
+    :param float inner_radius: inner radius (size of hollow)
+
+    :returns: True if the inner arc collapses onto the sphere center
+    :rtype: bool
+    """
+    return abs(inner_radius) <= ZERO_TOLERANCE
+
+
+def is_axisymmetric(revolution_angle):
+    """Return True if the revolution angle is zero and the part should be drawn as a 2D axisymmetric shell
+
+    Scalar equivalent of ``numpy.isclose(revolution_angle, 0.0)`` using :attr:`ZERO_TOLERANCE`.
+
+    :param float revolution_angle: angle of solid revolution for ``3D`` geometries
+
+    :returns: True if the revolution angle is zero
+    :rtype: bool
+    """
+    return abs(revolution_angle) <= ZERO_TOLERANCE
+
+
 def scale_and_offset_coordinates(coordinates, unit_conversion=1.0, y_offset=0.0):
     """Scale and offset XY coordinates in a 2 column numpy array
 
-    First multiply by the unit conversion. Then offset the Y coordinates (2nd column) by adding the y offset
+    First multiply by the unit conversion. Then offset the Y coordinates (2nd column) by adding the y offset. The
+    coordinates are always returned as a float array. If the unit conversion and y offset are the default values and
+    the coordinates are already a float array, the coordinates are returned without a copy, so the returned array may
+    alias the input array.
 
     :param numpy.array coordinates: [N, 2] array of XY coordinates.
     :param float unit_conversion: multiplication factor applies to all coordinates
     :param float y_offset: vertical offset along the global Y-axis. Offset should be provided in units *after* the unit
         conversion.
+
+    :returns: [N, 2] float array of scaled and offset XY coordinates
+    :rtype: numpy.array
     """
+    coordinates = numpy.asarray(coordinates, dtype=float)
+    if unit_conversion == 1.0 and y_offset == 0.0:
+        return coordinates
     coordinates = coordinates * unit_conversion
     coordinates[:, 1] += y_offset
     return coordinates
@@ -122,26 +162,31 @@ def lines_and_splines(coordinates, euclidean_distance, rtol=None, atol=None):
     :param float rtol: relative tolerance used by ``numpy.isclose``. If None, use the numpy default.
     :param float atol: absolute tolerance used by ``numpy.isclose``. If None, use the numpy default.
 
-    :returns: list of line pairs and list of spline arrays
+    :returns: list of [2, 2] line pair arrays and list of [N, 2] spline arrays
     :rtype: tuple
     """
     all_splines = _break_coordinates(coordinates, euclidean_distance, rtol=rtol, atol=atol)
     lines = _line_pairs(all_splines)
-    lines.extend([numpy.stack((array[0], array[1])) for array in all_splines if len(array) == 2])
-    splines = [array for array in all_splines if len(array) > 2]
+    splines = []
+    for array in all_splines:
+        length = len(array)
+        if length == 2:
+            lines.append(array)
+        elif length > 2:
+            splines.append(array)
     return lines, splines
 
 
 def ordered_lines_and_splines(coordinates, euclidean_distance, rtol=None, atol=None):
     """Return a single, closed loop list of [M, 2] arrays with lines (length 2) and splines (length >2)"""
     all_splines = _break_coordinates(coordinates, euclidean_distance, rtol=rtol, atol=atol)
-    lines_and_splines = [all_splines[0]]
-    for spline1, spline2 in zip(all_splines[0:-1], all_splines[1:]):
-        lines_and_splines.append(numpy.stack((spline1[-1], spline2[0])))
-        lines_and_splines.append(spline2)
-    lines_and_splines.append(numpy.stack((all_splines[-1][-1], all_splines[0][0])))
-    # Eliminate points after creating line connections
-    lines_and_splines = [array for array in lines_and_splines if len(array) > 1]
+    line_pairs = _line_pairs(all_splines)
+    lines_and_splines = []
+    for spline, line in zip(all_splines, line_pairs):
+        # Eliminate points after creating line connections
+        if len(spline) > 1:
+            lines_and_splines.append(spline)
+        lines_and_splines.append(line)
     return lines_and_splines
 
 
@@ -165,8 +210,7 @@ def _break_coordinates(coordinates, euclidean_distance, rtol=None, atol=None):
     """
     euclidean_distance_bools = _compare_euclidean_distance(coordinates, euclidean_distance)
     vertical_horizontal_bools = _compare_xy_values(coordinates, rtol=rtol, atol=atol)
-    bools_from_or = _bool_via_or(euclidean_distance_bools, vertical_horizontal_bools)
-    break_indices = numpy.where(bools_from_or)[0]
+    break_indices = numpy.flatnonzero(euclidean_distance_bools | vertical_horizontal_bools)
     all_splines = numpy.split(coordinates, break_indices, axis=0)
     return all_splines
 
@@ -177,27 +221,32 @@ def _compare_euclidean_distance(coordinates, euclidean_distance):
     The distance comparison is performed as ``numpy_array_distance > euclidean_distance``. The distance between
     coordinates in the numpy array is computed such that the "current point" is compared to the previous point in the
     list. As such, a single ``False`` is always prepended to the beginning of the output ``euclidean_distance_bools``
-    list, because there is no such distance between the first point and one that comes before it.
+    array, because there is no such distance between the first point and one that comes before it. Squared distances
+    are compared to avoid the square root of every distance. Squaring loses the sign of a negative
+    ``euclidean_distance``, so a negative value breaks between every pair of points, as the unsquared comparison would.
 
     :param numpy.array coordinates: [N, 2] array of XY coordinates.
     :param float euclidean_distance: distance value to compare against
 
     :return: bools for the distance comparison
-    :rtype: list of length N
+    :rtype: numpy.array of length N
     """
-    calculated_euclidean_array = numpy.linalg.norm(coordinates[1:, :] - coordinates[0:-1, :], axis=1)
-    euclidean_distance_bools = [False] + [
-        this_euclidean_distance > euclidean_distance for this_euclidean_distance in calculated_euclidean_array
-    ]
+    difference = coordinates[1:, :] - coordinates[0:-1, :]
+    squared_distance = numpy.einsum("ij,ij->i", difference, difference)
+    if euclidean_distance < 0.0:
+        longer_bools = numpy.ones(squared_distance.shape, dtype=bool)
+    else:
+        longer_bools = squared_distance > euclidean_distance**2
+    euclidean_distance_bools = numpy.concatenate(([False], longer_bools))
     return euclidean_distance_bools
 
 
 def _compare_xy_values(coordinates, rtol=None, atol=None):
     """Check neighboring XY values in an [N, 2] array of coordinates for vertical or horizontal relationships
 
-    This function loops through lists of coordinates checking to see if a "current point" and the previous point in the
-    numpy array are vertical or hozitonal from one another. As such, a single ``False`` is always prepended to the
-    beginning of the output ``vertical_horizontal_bools`` list, because there is no such vertical/horizontal
+    This function compares the array of coordinates to itself, checking to see if a "current point" and the previous
+    point in the numpy array are vertical or hozitonal from one another. As such, a single ``False`` is always prepended
+    to the beginning of the output ``vertical_horizontal_bools`` array, because there is no such vertical/horizontal
     relationship between the first point and one that comes before it.
 
     :param numpy.array coordinates: [N, 2] array of XY coordinates.
@@ -205,48 +254,32 @@ def _compare_xy_values(coordinates, rtol=None, atol=None):
     :param float atol: absolute tolerance used by ``numpy.isclose``. If None, use the numpy default.
 
     :return: bools for vertical/horizontal relationship comparison
-    :rtype: list of length N
+    :rtype: numpy.array of length N
     """
     isclose_kwargs = {}
     if rtol is not None:
         isclose_kwargs.update({"rtol": rtol})
     if atol is not None:
         isclose_kwargs.update({"atol": atol})
-    vertical_horizontal_bools = [False] + [
-        numpy.isclose(coords1[0], coords2[0], **isclose_kwargs)  # noqa: W504
-        or numpy.isclose(coords1[1], coords2[1], **isclose_kwargs)  # noqa: W503
-        for coords1, coords2 in zip(coordinates[1:, :], coordinates[0:-1, :])
-    ]
+    isclose = numpy.isclose(coordinates[1:, :], coordinates[0:-1, :], **isclose_kwargs)
+    vertical_horizontal_bools = numpy.concatenate(([False], isclose.any(axis=1)))
     return vertical_horizontal_bools
 
 
-def _bool_via_or(bools_list_1, bools_list_2):
-    """Compare two lists of bools using an ``or`` statement
-
-    :param list bools_list_1: first set of bools
-    :param list bools_list_2: second set of bools
-
-    :return: bools resulting from ``or`` statment
-    :rtype: list
-    """
-    bools_from_or = [a or b for a, b in zip(bools_list_1, bools_list_2)]
-    return bools_from_or
-
-
 def _line_pairs(all_splines):
     """Accept a list of [N, 2] arrays and return a list of paired coordinates to connect as lines
 
-    Given a list of [N, 2] numpy arrays, create tuple pairs of coordinates between the end and beginning of subsequent
-    arrays. Also return a pair from the last array's last coordinate to the first array's first coordinate.
+    Given a list of [N, 2] numpy arrays, create [2, 2] coordinate pair arrays between the end and beginning of
+    subsequent arrays. Also return a pair from the last array's last coordinate to the first array's first coordinate.
 
     :param list all_splines: a list of 2D numpy arrays
 
-    :returns: line pairs
+    :returns: line pairs, one (x, y) coordinate per row
     :rtype: list of [2, 2] numpy arrays
     """
-    zipped_splines = zip(all_splines[0:-1], all_splines[1:])
-    line_pairs = [numpy.stack((spline1[-1], spline2[0])) for spline1, spline2 in zipped_splines]
-    line_pairs.append((all_splines[-1][-1], all_splines[0][0]))
+    ends = numpy.array([spline[-1] for spline in all_splines])
+    starts = numpy.roll([spline[0] for spline in all_splines], -1, axis=0)
+    line_pairs = list(numpy.stack((ends, starts), axis=1))
     return line_pairs
 
 
@@ -265,6 +298,17 @@ def normalize_vector(vector):
     return vector / norm
 
 
+def _normalize_rows(vectors):
+    """Normalize each row of an [N, M] array of vectors
+
+    :param numpy.array vectors: [N, M] array of non-zero vectors
+
+    :returns: [N, M] array of unit vectors
+    :rtype: numpy.array
+    """
+    return vectors / numpy.linalg.norm(vectors, axis=1, keepdims=True)
+
+
 def midpoint_vector(first, second, third=None):
     """Calculate the vector between two vectors (summation / 2)
 
@@ -346,17 +390,18 @@ def datum_planes(xvector, zvector):
 
     primary_planes = [xy_plane, yz_plane, zx_plane]
 
-    midpoints = [
-        midpoint_vector(xvector,  yvector),  # fmt: skip # noqa: E201,E241
-        midpoint_vector(xvector, -yvector),  # fmt: skip # noqa: E201,E241
-        midpoint_vector(yvector,  zvector),  # fmt: skip # noqa: E201,E241
-        midpoint_vector(yvector, -zvector),  # fmt: skip # noqa: E201,E241
-        midpoint_vector(zvector,  xvector),  # fmt: skip # noqa: E201,E241
-        midpoint_vector(zvector, -xvector),  # fmt: skip # noqa: E201,E241
-    ]
-    midpoints = [normalize_vector(midpoint) for midpoint in midpoints]
+    # Signed (x, y, z) basis combinations of the 45 degree plane normals
+    midpoint_signs = numpy.array([
+        [ 1.,  1.,  0.],  # x + y  # fmt: skip # noqa: E201,E241
+        [ 1., -1.,  0.],  # x - y  # fmt: skip # noqa: E201,E241
+        [ 0.,  1.,  1.],  # y + z  # fmt: skip # noqa: E201,E241
+        [ 0.,  1., -1.],  # y - z  # fmt: skip # noqa: E201,E241
+        [ 1.,  0.,  1.],  # z + x  # fmt: skip # noqa: E201,E241
+        [-1.,  0.,  1.],  # z - x  # fmt: skip # noqa: E201,E241
+    ])  # fmt: skip
+    midpoints = _normalize_rows(numpy.dot(midpoint_signs, numpy.array([xvector, yvector, zvector])))
 
-    return primary_planes + midpoints
+    return primary_planes + list(midpoints)
 
 
 def fortyfive_vectors(xvector, zvector):
@@ -370,19 +415,20 @@ def fortyfive_vectors(xvector, zvector):
     zvector = normalize_vector(zvector)
     yvector = numpy.cross(zvector, xvector)
 
-    fortyfives = [
-        midpoint_vector( xvector,  yvector,  zvector),  # 0  # fmt: skip # noqa: E201,E241
-        midpoint_vector(-xvector,  yvector,  zvector),  # 1  # fmt: skip # noqa: E201,E241
-        midpoint_vector(-xvector,  yvector, -zvector),  # 2  # fmt: skip # noqa: E201,E241
-        midpoint_vector( xvector,  yvector, -zvector),  # 3  # fmt: skip # noqa: E201,E241
-        midpoint_vector( xvector, -yvector,  zvector),  # 4  # fmt: skip # noqa: E201,E241
-        midpoint_vector(-xvector, -yvector,  zvector),  # 5  # fmt: skip # noqa: E201,E241
-        midpoint_vector(-xvector, -yvector, -zvector),  # 6  # fmt: skip # noqa: E201,E241
-        midpoint_vector( xvector, -yvector, -zvector),  # 7  # fmt: skip # noqa: E201,E241
-    ]
-    fortyfives = [normalize_vector(vector) for vector in fortyfives]
-
-    return fortyfives
+    # Signed (x, y, z) basis combinations of the cube vertex directions
+    fortyfive_signs = numpy.array([
+        [ 1.,  1.,  1.],  # 0  # fmt: skip # noqa: E201,E241
+        [-1.,  1.,  1.],  # 1  # fmt: skip # noqa: E201,E241
+        [-1.,  1., -1.],  # 2  # fmt: skip # noqa: E201,E241
+        [ 1.,  1., -1.],  # 3  # fmt: skip # noqa: E201,E241
+        [ 1., -1.,  1.],  # 4  # fmt: skip # noqa: E201,E241
+        [-1., -1.,  1.],  # 5  # fmt: skip # noqa: E201,E241
+        [-1., -1., -1.],  # 6  # fmt: skip # noqa: E201,E241
+        [ 1., -1., -1.],  # 7  # fmt: skip # noqa: E201,E241
+    ])  # fmt: skip
+    fortyfives = _normalize_rows(numpy.dot(fortyfive_signs, numpy.array([xvector, yvector, zvector])))
+
+    return list(fortyfives)
 
 
 def pyramid_surfaces(center, xvector, zvector, big_number):
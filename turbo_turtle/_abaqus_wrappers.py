@@ -11,24 +11,24 @@ def geometry(args, command):
     """
     script = _settings._abaqus_python_abspath / "geometry.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {_utilities.character_delimited_list(args.input_file)} "
-    command += f"--output-file {args.output_file} "
-    command += f"--unit-conversion {args.unit_conversion} "
-    command += f"--euclidean-distance {args.euclidean_distance} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", *map(str, args.input_file)]
+    command += ["--output-file", str(args.output_file)]
+    command += ["--unit-conversion", str(args.unit_conversion)]
+    command += ["--euclidean-distance", str(args.euclidean_distance)]
     if args.planar:
-        command += f"--planar "
-    command += f"--model-name {args.model_name} "
+        command += ["--planar"]
+    command += ["--model-name", str(args.model_name)]
     if args.part_name[0] is not None:
-        command += f"--part-name {_utilities.character_delimited_list(args.part_name)} "
-    command += f"--delimiter {args.delimiter} "
-    command += f"--header-lines {args.header_lines} "
-    command += f"--revolution-angle {args.revolution_angle} "
-    command += f"--y-offset {args.y_offset} "
+        command += ["--part-name", *map(str, args.part_name)]
+    command += ["--delimiter", str(args.delimiter)]
+    command += ["--header-lines", str(args.header_lines)]
+    command += ["--revolution-angle", str(args.revolution_angle)]
+    command += ["--y-offset", str(args.y_offset)]
     if args.rtol is not None:
-        command += f"--rtol {args.rtol} "
+        command += ["--rtol", str(args.rtol)]
     if args.atol is not None:
-        command += f"--atol {args.atol} "
+        command += ["--atol", str(args.atol)]
     _utilities.run_command(command)
 
 
@@ -41,15 +41,15 @@ def cylinder(args, command):
     """
     script = _settings._abaqus_python_abspath / "cylinder.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--inner-radius {args.inner_radius} "
-    command += f"--outer-radius {args.outer_radius} "
-    command += f"--height {args.height} "
-    command += f"--output-file {args.output_file} "
-    command += f"--model-name {args.model_name} "
-    command += f"--part-name {args.part_name} "
-    command += f"--revolution-angle {args.revolution_angle} "
-    command += f"--y-offset {args.y_offset}"
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--inner-radius", str(args.inner_radius)]
+    command += ["--outer-radius", str(args.outer_radius)]
+    command += ["--height", str(args.height)]
+    command += ["--output-file", str(args.output_file)]
+    command += ["--model-name", str(args.model_name)]
+    command += ["--part-name", str(args.part_name)]
+    command += ["--revolution-angle", str(args.revolution_angle)]
+    command += ["--y-offset", str(args.y_offset)]
     _utilities.run_command(command)
 
 
@@ -62,14 +62,14 @@ def sphere(args, command):
     """
     script = _settings._abaqus_python_abspath / "sphere.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--inner-radius {args.inner_radius} --outer-radius {args.outer_radius} "
-    command += f"--output-file {args.output_file} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--inner-radius", str(args.inner_radius), "--outer-radius", str(args.outer_radius)]
+    command += ["--output-file", str(args.output_file)]
     if args.input_file is not None:
-        command += f"--input-file {args.input_file} "
-    command += f"--quadrant {args.quadrant} --revolution-angle {args.revolution_angle} "
-    command += f"--y-offset {args.y_offset} "
-    command += f"--model-name {args.model_name} --part-name {args.part_name}"
+        command += ["--input-file", str(args.input_file)]
+    command += ["--quadrant", str(args.quadrant), "--revolution-angle", str(args.revolution_angle)]
+    command += ["--y-offset", str(args.y_offset)]
+    command += ["--model-name", str(args.model_name), "--part-name", str(args.part_name)]
     _utilities.run_command(command)
 
 
@@ -82,15 +82,15 @@ def partition(args, command):
     """
     script = _settings._abaqus_python_abspath / "partition.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {args.input_file} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", str(args.input_file)]
     if args.output_file is not None:
-        command += f"--output-file {args.output_file} "
-    command += f"--center {_utilities.character_delimited_list(args.center)} "
-    command += f"--xvector {_utilities.character_delimited_list(args.xvector)} "
-    command += f"--zvector {_utilities.character_delimited_list(args.zvector)} "
-    command += f"--model-name {args.model_name} --part-name {_utilities.character_delimited_list(args.part_name)} "
-    command += f"--big-number {args.big_number}"
+        command += ["--output-file", str(args.output_file)]
+    command += ["--center", *map(str, args.center)]
+    command += ["--xvector", *map(str, args.xvector)]
+    command += ["--zvector", *map(str, args.zvector)]
+    command += ["--model-name", str(args.model_name), "--part-name", *map(str, args.part_name)]
+    command += ["--big-number", str(args.big_number)]
     _utilities.run_command(command)
 
 
@@ -103,20 +103,17 @@ def sets(args, command):
     """
     script = _settings._abaqus_python_abspath / "sets.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {args.input_file} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", str(args.input_file)]
     if args.output_file is not None:
-        command += f"--output-file {args.output_file} "
-    command += f"--model-name {args.model_name} --part-name {args.part_name} "
+        command += ["--output-file", str(args.output_file)]
+    command += ["--model-name", str(args.model_name), "--part-name", str(args.part_name)]
     if args.face_sets is not None:
-        face_sets = [[name, f'"{mask}"'] for name, mask in args.face_sets]
-        command += _utilities.construct_append_options("--face-set", face_sets) + " "
+        command += _utilities.construct_append_arguments("--face-set", args.face_sets)
     if args.edge_sets is not None:
-        edge_sets = [[name, f'"{mask}"'] for name, mask in args.edge_sets]
-        command += _utilities.construct_append_options("--edge-set", edge_sets) + " "
+        command += _utilities.construct_append_arguments("--edge-set", args.edge_sets)
     if args.vertex_sets is not None:
-        vertex_sets = [[name, f'"{mask}"'] for name, mask in args.vertex_sets]
-        command += _utilities.construct_append_options("--vertex-set", vertex_sets)
+        command += _utilities.construct_append_arguments("--vertex-set", args.vertex_sets)
     _utilities.run_command(command)
 
 
@@ -129,15 +126,15 @@ def mesh(args, command):
     """
     script = _settings._abaqus_python_abspath / "mesh_module.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {args.input_file} "
-    command += f"--element-type {args.element_type} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", str(args.input_file)]
+    command += ["--element-type", str(args.element_type)]
     if args.output_file is not None:
-        command += f"--output-file {args.output_file} "
-    command += f"--model-name {args.model_name} --part-name {args.part_name} "
-    command += f"--global-seed {args.global_seed} "
+        command += ["--output-file", str(args.output_file)]
+    command += ["--model-name", str(args.model_name), "--part-name", str(args.part_name)]
+    command += ["--global-seed", str(args.global_seed)]
     if args.edge_seeds is not None:
-        command += _utilities.construct_append_options("--edge-seed", args.edge_seeds)
+        command += _utilities.construct_append_arguments("--edge-seed", args.edge_seeds)
     _utilities.run_command(command)
 
 
@@ -150,14 +147,14 @@ def merge(args, command):
     """
     script = _settings._abaqus_python_abspath / "merge.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {_utilities.character_delimited_list(args.input_file)} "
-    command += f"--output-file {args.output_file} "
-    command += f"--merged-model-name {args.merged_model_name} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", *map(str, args.input_file)]
+    command += ["--output-file", str(args.output_file)]
+    command += ["--merged-model-name", str(args.merged_model_name)]
     if args.model_name[0] is not None:
-        command += f"--model-name {_utilities.character_delimited_list(args.model_name)} "
+        command += ["--model-name", *map(str, args.model_name)]
     if args.part_name[0] is not None:
-        command += f"--part-name {_utilities.character_delimited_list(args.part_name)}"
+        command += ["--part-name", *map(str, args.part_name)]
     _utilities.run_command(command)
 
 
@@ -170,14 +167,14 @@ def export(args, command):
     """
     script = _settings._abaqus_python_abspath / "export.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {args.input_file} "
-    command += f"--model-name {args.model_name} --part-name {_utilities.character_delimited_list(args.part_name)} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", str(args.input_file)]
+    command += ["--model-name", str(args.model_name), "--part-name", *map(str, args.part_name)]
     if args.element_type[0] is not None:
-        command += f"--element-type {_utilities.character_delimited_list(args.element_type)} "
-    command += f"--destination {args.destination} "
+        command += ["--element-type", *map(str, args.element_type)]
+    command += ["--destination", str(args.destination)]
     if args.assembly is not None:
-        command += f"--assembly {args.assembly}"
+        command += ["--assembly", str(args.assembly)]
     _utilities.run_command(command)
 
 
@@ -190,15 +187,15 @@ def image(args, command):
     """
     script = _settings._abaqus_python_abspath / "image.py"
 
-    command = f"{command} cae -noGui {script} -- "
-    command += f"--input-file {args.input_file} "
-    command += f"--output-file {args.output_file} "
-    command += f"--x-angle {args.x_angle} "
-    command += f"--y-angle {args.y_angle} "
-    command += f"--z-angle {args.z_angle} "
-    command += f"--image-size {_utilities.character_delimited_list(args.image_size)} "
-    command += f"--model-name {args.model_name} "
+    command = [command, "cae", "-noGui", str(script), "--"]
+    command += ["--input-file", str(args.input_file)]
+    command += ["--output-file", str(args.output_file)]
+    command += ["--x-angle", str(args.x_angle)]
+    command += ["--y-angle", str(args.y_angle)]
+    command += ["--z-angle", str(args.z_angle)]
+    command += ["--image-size", *map(str, args.image_size)]
+    command += ["--model-name", str(args.model_name)]
     if args.part_name is not None:
-        command += f"--part-name {args.part_name} "
-    command += f"--color-map {args.color_map}"
+        command += ["--part-name", str(args.part_name)]
+    command += ["--color-map", str(args.color_map)]
     _utilities.run_command(command)
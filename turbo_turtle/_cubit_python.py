@@ -36,6 +36,26 @@ def cubit_command_or_exception(command):
     return success
 
 
+def _command_last_id(command, entity):
+    """Run a Cubit command that creates one entity and return the new entity ID
+
+    Compares ``cubit.get_last_id`` before and after the command. Raises a RuntimeError if the command succeeds without
+    creating a new entity, rather than returning the ID of an existing entity.
+
+    :param str command: Cubit APREPRO command to execute
+    :param str entity: Cubit entity type, e.g. ``curve`` or ``volume``
+
+    :returns: ID of the new entity
+    :rtype: int
+    """
+    last_id = cubit.get_last_id(entity)
+    cubit_command_or_exception(command)
+    new_id = cubit.get_last_id(entity)
+    if new_id == last_id:
+        raise RuntimeError(f"Command '{command}' did not create a new {entity}")
+    return new_id
+
+
 def geometry(
     input_file,
     output_file,
@@ -111,8 +131,8 @@ def _draw_surface(lines, splines):
         point2 = tuple(second) + (0.0,)
         curves.append(create_curve_from_coordinates(point1, point2))
     for spline in splines:
-        zero_column = numpy.zeros([len(spline), 1])
-        spline_3d = numpy.append(spline, zero_column, axis=1)
+        spline_3d = numpy.zeros((len(spline), 3))
+        spline_3d[:, :2] = spline
         curves.append(create_spline_from_coordinates(spline_3d))
     return cubit.create_surface(curves)
 
@@ -144,15 +164,11 @@ def create_spline_from_coordinates(coordinates):
     if coordinates.shape[0] < minimum:
         raise RuntimeError(f"Requires at least {minimum} coordinates to create a spline")
 
-    points = []
-    for point in coordinates:
-        points.append(cubit.create_vertex(*tuple(point)))
-    vertex_ids = [point.id() for point in points]
-    vertex_ids_text = _utilities.character_delimited_list(vertex_ids)
+    # Spline through locations in a single command instead of one Cubit call per free vertex
+    locations = " ".join(f"location {x} {y} {z}" for x, y, z in coordinates.tolist())
     # TODO: Find a suitable Cubit Python function for creating splines that returns the curve object
-    cubit_command_or_exception(f"create curve spline vertex {vertex_ids_text} delete")
-    curve = points[0].curves()[0]
-    return curve
+    curve_id = _command_last_id(f"create curve spline {locations}", "curve")
+    return cubit.curve(curve_id)
 
 
 def create_arc_from_coordinates(center, point1, point2):
@@ -199,8 +215,7 @@ def create_surface_from_coordinates(coordinates):
     if coordinates.shape[0] < 3:
         raise RuntimeError("Requires at least 3 coordinates to create a surface")
     curves = []
-    last = numpy.array([coordinates[-1]])
-    coordinates_shift = numpy.append(last, coordinates[0:-1], axis=0)
+    coordinates_shift = numpy.roll(coordinates, 1, axis=0)
     for point1, point2 in zip(coordinates, coordinates_shift):
         curves.append(create_curve_from_coordinates(point1, point2))
     return cubit.create_surface(curves)
@@ -217,16 +232,20 @@ def _surface_numbers(surfaces):
     return [surface.surfaces()[0].id() for surface in surfaces]
 
 
-def _surface_centroids(surfaces):
-    """Return a list of 3D surface centroids from the provided list of surface objects
+def _surface_centroids(surfaces, surface_ids=None):
+    """Return an array of 3D surface centroids from the provided list of surface objects
 
     :param list surfaces: list of Cubit surface objects
+    :param list surface_ids: pre-computed IDs of ``surfaces``. Queried from Cubit if not provided.
 
-    :returns: list of surface centroids
-    :rtype: list of numpy.arrays
+    :returns: [N, 3] array of surface centroids
+    :rtype: numpy.array
     """
-    surface_ids = _surface_numbers(surfaces)
-    surface_centroids = [numpy.array(cubit.get_surface_centroid(id)) for id in surface_ids]
+    if surface_ids is None:
+        surface_ids = _surface_numbers(surfaces)
+    surface_centroids = numpy.empty((len(surface_ids), 3))
+    for row, surface_id in enumerate(surface_ids):
+        surface_centroids[row] = cubit.get_surface_centroid(surface_id)
     return surface_centroids
 
 
@@ -244,7 +263,7 @@ def _surfaces_for_volumes(volumes):
     return surfaces
 
 
-def _surfaces_by_vector(surfaces, principal_vector, center=numpy.zeros(3)):
+def _surfaces_by_vector(surfaces, principal_vector, center=numpy.zeros(3), surface_centroids=None):
     """Return a flat list of Cubit surface objects that meet the requirement of a
     positive dot product between a given vector and the vector between two points:
     a user provided center point and a surface object centroid.
@@ -252,19 +271,20 @@ def _surfaces_by_vector(surfaces, principal_vector, center=numpy.zeros(3)):
     :param list surfaces: list of Cubit surface objects
     :param numpy.array principal_vector: Local principal axis vector defined in global coordinates
     :param numpy.array center: center location of the geometry
+    :param numpy.array surface_centroids: [N, 3] pre-computed centroids of ``surfaces``. Queried from Cubit if not
+        provided.
 
     :returns: numpy.array of Cubit surface objects
     :rtype: numpy.array
     """
-    surface_centroids = _surface_centroids(surfaces)
-    direction_vectors = [numpy.subtract(centroid, center) for centroid in surface_centroids]
+    if surface_centroids is None:
+        surface_centroids = _surface_centroids(surfaces)
+    direction_vectors = numpy.asarray(surface_centroids) - center
 
-    vector_dot = numpy.array(
-        ([numpy.dot(direction_vector, principal_vector) for direction_vector in direction_vectors])
-    )
+    vector_dot = direction_vectors @ numpy.asarray(principal_vector)
     # Account for numerical errors in significant digits
     vector_dot[numpy.isclose(vector_dot, 0.0)] = 0.0
-    return numpy.array(surfaces)[numpy.where(vector_dot > 0.0)]
+    return numpy.array(surfaces)[vector_dot > 0.0]
 
 
 def _create_volume_from_surfaces(surfaces, keep=True):
@@ -276,17 +296,13 @@ def _create_volume_from_surfaces(surfaces, keep=True):
     :returns: Cubit volume object
     :rtype: cubit.Volume
     """
-    volumes_before = cubit.get_entities("volume")
     surface_numbers = _surface_numbers(surfaces)
     surface_string = _utilities.character_delimited_list(surface_numbers)
     command = f"create volume surface {surface_string} heal"
     if keep:
         command = f"{command} keep"
     # TODO: Recover volume object directly when creation is possible with Cubit Python API
-    cubit_command_or_exception(command)
-    volumes_after = cubit.get_entities("volume")
-    volume_id = list(set(volumes_after) - set(volumes_before))
-    volume_id = volume_id[0]
+    volume_id = _command_last_id(command, "volume")
     return cubit.volume(volume_id)
 
 
@@ -333,22 +349,33 @@ def _rename_and_sweep(
     return return_object
 
 
-def _get_volumes_from_name(names):
-    """Return all volume objects with a prefix from the ``names`` list
+def _get_volume_numbers_from_name(names):
+    """Return all volume IDs with a prefix from the ``names`` list
 
     :param list names: Name(s) prefix to search for with ``cubit.get_all_ids_from_name``
 
-    :returns: list of Cubit volumes with name prefix
-    :rtype: list of cubit.Volume objects
+    :returns: list of Cubit volume IDs with name prefix
+    :rtype: list of int
     """
     if isinstance(names, str):
         names = [names]
-    parts = []
+    numbers = []
     for name in names:
-        parts.extend([cubit.volume(number) for number in cubit.get_all_ids_from_name("volume", name)])
-    if len(parts) < 1:
+        numbers.extend(cubit.get_all_ids_from_name("volume", name))
+    if len(numbers) < 1:
         raise RuntimeError(f"Could not find any volumes with prefix '{name}'")
-    return parts
+    return numbers
+
+
+def _get_volumes_from_name(names):
+    """Return all volume objects with a prefix from the ``names`` list
+
+    :param list names: Name(s) prefix to search for with ``cubit.get_all_ids_from_name``
+
+    :returns: list of Cubit volumes with name prefix
+    :rtype: list of cubit.Volume objects
+    """
+    return [cubit.volume(number) for number in _get_volume_numbers_from_name(names)]
 
 
 def cylinder(
@@ -465,7 +492,7 @@ def _sphere(
 
     center_3d = numpy.append(center, [0.0])
     curves = []
-    if numpy.allclose(inner_point1, center) and numpy.allclose(inner_point2, center):
+    if vertices.is_solid_sphere(inner_radius):
         inner_point1 = center
         inner_point2 = center
     else:
@@ -483,8 +510,7 @@ def imprint_and_merge(names):
 
     :param list names: Name(s) prefix to search for with ``cubit.get_all_ids_from_name``
     """
-    parts = _get_volumes_from_name(names)
-    part_ids = [part.id() for part in parts]
+    part_ids = _get_volume_numbers_from_name(names)
     part_string = _utilities.character_delimited_list(part_ids)
 
     cubit_command_or_exception(f"imprint volume {part_string}")
@@ -518,8 +544,7 @@ def webcut_local_coordinate_primary_planes(center, xvector, zvector, names):
 
     # Webcut with local coordinate system primary planes
     for number in primary_surface_numbers:
-        parts = _get_volumes_from_name(names)
-        part_ids = [part.id() for part in parts]
+        part_ids = _get_volume_numbers_from_name(names)
         part_string = _utilities.character_delimited_list(part_ids)
         cubit_command_or_exception(f"webcut volume {part_string} with plane from surface {number}")
 
@@ -549,20 +574,21 @@ def create_pyramid_volumes(center, xvector, zvector, size):
     # Create 6 4-sided pyramidal bodies defining the partitioning intersections
     surface_coordinates = vertices.pyramid_surfaces(center, xvector, zvector, size)
     pyramid_surfaces = [create_surface_from_coordinates(coordinates) for coordinates in surface_coordinates]
+    surface_numbers = _surface_numbers(pyramid_surfaces)
+    pyramid_centroids = _surface_centroids(pyramid_surfaces, surface_numbers)
 
     # Identify surfaces for individual pyramid volumes based on location relative to local coordinate system
     pyramid_volume_surfaces = [
-        _surfaces_by_vector(pyramid_surfaces,  yvector, center),  # +Y  # fmt: skip # noqa: E241
-        _surfaces_by_vector(pyramid_surfaces, -yvector, center),  # -Y  # fmt: skip # noqa: E241
-        _surfaces_by_vector(pyramid_surfaces,  xvector, center),  # +X  # fmt: skip # noqa: E241
-        _surfaces_by_vector(pyramid_surfaces, -xvector, center),  # -X  # fmt: skip # noqa: E241
-        _surfaces_by_vector(pyramid_surfaces,  zvector, center),  # +Z  # fmt: skip # noqa: E241
-        _surfaces_by_vector(pyramid_surfaces, -zvector, center),  # -Z  # fmt: skip # noqa: E241
+        _surfaces_by_vector(pyramid_surfaces,  yvector, center, pyramid_centroids),  # +Y  # fmt: skip # noqa: E241
+        _surfaces_by_vector(pyramid_surfaces, -yvector, center, pyramid_centroids),  # -Y  # fmt: skip # noqa: E241
+        _surfaces_by_vector(pyramid_surfaces,  xvector, center, pyramid_centroids),  # +X  # fmt: skip # noqa: E241
+        _surfaces_by_vector(pyramid_surfaces, -xvector, center, pyramid_centroids),  # -X  # fmt: skip # noqa: E241
+        _surfaces_by_vector(pyramid_surfaces,  zvector, center, pyramid_centroids),  # +Z  # fmt: skip # noqa: E241
+        _surfaces_by_vector(pyramid_surfaces, -zvector, center, pyramid_centroids),  # -Z  # fmt: skip # noqa: E241
     ]
     pyramid_volumes = [_create_volume_from_surfaces(surface_list) for surface_list in pyramid_volume_surfaces]
 
     # Remove pyramidal construction surfaces
-    surface_numbers = _surface_numbers(pyramid_surfaces)
     surface_string = _utilities.character_delimited_list(surface_numbers)
     cubit_command_or_exception(f"delete surface {surface_string}")
     # TODO: ^^ Move pyramid volume creation to a dedicated function ^^
@@ -588,13 +614,12 @@ def create_pyramid_partitions(center, xvector, zvector, size, names):
     pyramid_volume_string = _utilities.character_delimited_list(pyramid_volume_numbers)
 
     # Create pyramidal intersections/partitions
-    parts = _get_volumes_from_name(names)
-    for volume in pyramid_volumes:
-        volume_id = volume.id()
-        for part in parts:
-            cubit_command_or_exception(f"intersect volume {volume_id} with volume {part.id()} keep")
-    for part in parts:
-        cubit_command_or_exception(f"delete volume {part.id()}")
+    part_ids = _get_volume_numbers_from_name(names)
+    for volume_id in pyramid_volume_numbers:
+        for part_id in part_ids:
+            cubit_command_or_exception(f"intersect volume {volume_id} with volume {part_id} keep")
+    for part_id in part_ids:
+        cubit_command_or_exception(f"delete volume {part_id}")
 
     # Clean up pyramid volumes
     cubit_command_or_exception(f"delete volume {pyramid_volume_string}")
@@ -1039,5 +1064,5 @@ def image(
         journal_file.write(f"rotate {z_angle} about world z\n")
         journal_file.write(f"hardcopy '{output_file}' {output_type}\n")
 
-    command = f"{cubit_command} -batch {journal_path}"
+    command = [str(cubit_command), "-batch", str(journal_path)]
     _utilities.run_command(command)
@@ -5,6 +5,7 @@ import typing
 import filecmp
 import pathlib
 import argparse
+import concurrent.futures
 
 from turbo_turtle import _settings
 
@@ -224,19 +225,43 @@ def build_copy_tuples(
     return copy_tuples
 
 
+def _copy_required(source_file: pathlib.Path, destination_file: pathlib.Path) -> bool:
+    """Return True when destination file doesn't exist or doesn't match source file content
+
+    A missing destination file is caught from the file comparison's own ``os.stat`` call instead of a separate
+    existence check.
+
+    :param source_file: source file
+    :param destination_file: destination file
+
+    :returns: copy is required
+    """
+    try:
+        return not filecmp.cmp(source_file, destination_file, shallow=False)
+    except FileNotFoundError:
+        return True
+
+
 def conditional_copy(copy_tuples: typing.List[typing.Tuple[pathlib.Path, pathlib.Path]]) -> None:
     """Copy when destination file doesn't exist or doesn't match source file content
 
     Uses Python ``shutil.copyfile``, so meta data isn't preserved. Creates intermediate parent directories prior to
-    copy, but doesn't raise exceptions on existing parent directories.
+    copy, but doesn't raise exceptions on existing parent directories. Each parent directory is created once, regardless
+    of the number of files copied into it. Files are compared and copied in a thread pool to overlap the file I/O of
+    many small files.
 
     :param copy_tuples: Tuple of source, destination pathlib.Path pairs, e.g. ``((source, destination), ...)``
     """
-    for source_file, destination_file in copy_tuples:
+    with concurrent.futures.ThreadPoolExecutor() as executor:
         # If the root_directory and destination file contents are the same, don't perform unnecessary file I/O
-        if not destination_file.exists() or not filecmp.cmp(source_file, destination_file, shallow=False):
-            destination_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(source_file, destination_file)
+        comparisons = [executor.submit(_copy_required, *copy_tuple) for copy_tuple in copy_tuples]
+        copy_tuples = [copy_tuple for copy_tuple, future in zip(copy_tuples, comparisons) if future.result()]
+        for parent in sorted({destination_file.parent for _, destination_file in copy_tuples}):
+            parent.mkdir(parents=True, exist_ok=True)
+        copies = [executor.submit(shutil.copyfile, source, destination) for source, destination in copy_tuples]
+    # Re-raise any exceptions from the worker threads
+    for future in copies:
+        future.result()
 
 
 def print_list(things_to_print: list, prefix: str = "\t", stream=sys.stdout) -> None:
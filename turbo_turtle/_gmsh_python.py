@@ -334,7 +334,7 @@ def _sphere(
     outer_point2 = arc_points_3d[3]
 
     curves = []
-    if numpy.allclose(inner_point1, center_3d) and numpy.allclose(inner_point2, center_3d):
+    if vertices.is_solid_sphere(inner_radius):
         inner_point1 = center_3d
         inner_point2 = center_3d
     else:
@@ -11,7 +11,7 @@ import tempfile
 import functools
 import subprocess
 
-from turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities import print_exception_message
+from turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities import copyfile, print_exception_message
 
 
 class NamedTemporaryFileCopy:
@@ -27,7 +27,7 @@ class NamedTemporaryFileCopy:
 
     def __init__(self, input_file, *args, **kwargs):
         self.temporary_file = tempfile.NamedTemporaryFile(*args, delete=False, **kwargs)
-        shutil.copyfile(input_file, self.temporary_file.name)
+        copyfile(input_file, self.temporary_file.name)
 
     def __enter__(self):
         return self.temporary_file
@@ -151,12 +151,14 @@ def import_cubit():
     return cubit
 
 
-def run_command(command: str) -> None:
-    """Split command on whitespace, execute shell command, raise RuntimeError with any error message
+def run_command(command: typing.Union[str, typing.List[str]]) -> None:
+    """Execute shell command, raise RuntimeError with any error message
 
-    :param command: String to run on the shell
+    String commands are split with shell-like syntax. Argument lists are executed as-is.
+
+    :param command: String to run on the shell or list of command arguments
     """
-    command_list = shlex.split(command)
+    command_list = shlex.split(command) if isinstance(command, str) else command
     try:
         stdout = subprocess.check_output(command_list)
     except subprocess.CalledProcessError as err:
@@ -192,13 +194,14 @@ def set_wrappers_and_command(args: argparse.Namespace) -> typing.Tuple:
     return _wrappers, command
 
 
-def construct_append_options(
+def construct_append_arguments(
     option: str,
     array: typing.Iterable[typing.Tuple],
-) -> str:
-    """Construct a command string to match the argparse append action
+) -> typing.List[str]:
+    """Construct a command argument list to match the argparse append action
 
-    Build the repeated option string for argparse appending options that accept more than one value
+    Build the repeated option arguments for argparse appending options that accept more than one value. Each value is
+    a separate argument, so values containing whitespace do not need shell quoting.
 
     .. code-block::
 
@@ -208,18 +211,17 @@ def construct_append_options(
 
        >>> option = "--option"
        >>> array = [[1, 2], [3, 4]]
-       >>> construct_append_options(option, array)
-       "--option 1 2 --option 3 4"
+       >>> construct_append_arguments(option, array)
+       ["--option", "1", "2", "--option", "3", "4"]
 
     :param option: Text for the option, e.g. ``--option``
     :param array: 2D iterable of tuple arguments
     """
-    command_string = ""
+    arguments = []
     for row in array:
         if row:
-            command_string += f" {option} " + character_delimited_list(row)
-    command_string = command_string.strip()
-    return command_string
+            arguments += [option, *map(str, row)]
+    return arguments
 
 
 def character_delimited_list(sequence: typing.Iterable, character: str = " ") -> str:
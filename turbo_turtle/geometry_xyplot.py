@@ -2,12 +2,14 @@ import typing
 import argparse
 
 import numpy
-import matplotlib.pyplot
 
 from turbo_turtle._abaqus_python.turbo_turtle_abaqus import parsers
 from turbo_turtle._abaqus_python.turbo_turtle_abaqus import vertices
 from turbo_turtle._abaqus_python.turbo_turtle_abaqus import _mixed_utilities
 
+if typing.TYPE_CHECKING:
+    import matplotlib.figure
+
 
 _exclude_from_namespace = set(globals().keys())
 
@@ -46,7 +48,7 @@ def geometry_xyplot(
     no_markers: bool = parsers.geometry_xyplot_defaults["no_markers"],
     annotate: bool = parsers.geometry_xyplot_defaults["annotate"],
     scale: bool = parsers.geometry_xyplot_defaults["scale"],
-) -> matplotlib.pyplot.Figure:
+) -> "matplotlib.figure.Figure":
     """Return a matplotlib figure with the coordinates plotted consistently with geometry and geometry-xyplot
     subcommands
 
@@ -65,6 +67,8 @@ def geometry_xyplot(
 
     :returns: matplotlib figure
     """
+    # Defer the matplotlib import cost until a figure is requested. The parent CLI imports this module for the parser.
+    import matplotlib.pyplot
 
     if no_markers:
         line_kwargs = {}
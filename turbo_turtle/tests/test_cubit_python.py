@@ -32,6 +32,26 @@ def test_cubit_command_or_exception(command, outcome):
             pass
 
 
+command_last_id = {
+    "new vertex": ("create vertex 0 0 0", "vertex", does_not_raise()),
+    "no new curve": ("create vertex 0 0 0", "curve", pytest.raises(RuntimeError)),
+}
+
+
+@pytest.mark.parametrize(
+    "command, entity, outcome",
+    command_last_id.values(),
+    ids=command_last_id.keys(),
+)
+def test_command_last_id(command, entity, outcome):
+    with outcome:
+        try:
+            new_id = _cubit_python._command_last_id(command, entity)
+            assert new_id == cubit.get_last_id(entity)
+        finally:
+            pass
+
+
 create_curve_from_coordinates = {
     "float": (
         (0.0, 0.0, 0.0),
@@ -90,6 +110,9 @@ def test_create_spline_from_coordinates(coordinates, outcome):
         try:
             curve = _cubit_python.create_spline_from_coordinates(coordinates)
             assert curve.dimension() == 1
+            assert curve.id() == cubit.get_last_id("curve")
+            end_points = sorted(tuple(vertex.coordinates()) for vertex in curve.vertices())
+            assert numpy.allclose(end_points, sorted([tuple(coordinates[0]), tuple(coordinates[-1])]))
         finally:
             pass
 
@@ -151,3 +174,18 @@ def test_create_surface_from_coordinates(coordinates, outcome):
             assert len(surface.vertices()) == coordinates.shape[0]
         finally:
             pass
+
+
+def test_create_volume_from_surfaces():
+    cube_faces = [
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [0.0, 1.0, 0.0]],
+        [[0.0, 0.0, 1.0], [1.0, 0.0, 1.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0]],
+        [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 0.0, 1.0], [0.0, 0.0, 1.0]],
+        [[0.0, 1.0, 0.0], [1.0, 1.0, 0.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0]],
+        [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 1.0, 1.0], [0.0, 0.0, 1.0]],
+        [[1.0, 0.0, 0.0], [1.0, 1.0, 0.0], [1.0, 1.0, 1.0], [1.0, 0.0, 1.0]],
+    ]
+    surfaces = [_cubit_python.create_surface_from_coordinates(face) for face in cube_faces]
+    volume = _cubit_python._create_volume_from_surfaces(surfaces)
+    assert volume.id() == cubit.get_last_id("volume")
+    assert numpy.isclose(volume.volume(), 1.0)
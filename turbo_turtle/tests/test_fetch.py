@@ -59,31 +59,23 @@ def test_fetch():
 
 
 conditional_copy_input = {
-    "one new file": (one_file_copy_tuples, [False], [False], one_file_copy_tuples[0]),  # File does not exist
+    "one new file": (one_file_copy_tuples, [FileNotFoundError], one_file_copy_tuples[0]),  # File does not exist
     "one different file": (  # File does exist, but it's different from the source file
         one_file_copy_tuples,
-        [True],
         [False],
         one_file_copy_tuples[0],
     ),
-    "one identical file": (one_file_copy_tuples, [True], [True], None),  # File exists and is identical to source file
-    "one missing (different) file": (  # File doesn't exist and is identical to source file. Should never actually occur
-        one_file_copy_tuples,
-        [False],
-        [True],
-        one_file_copy_tuples[0],
-    ),
+    "one identical file": (one_file_copy_tuples, [True], None),  # File exists and is identical to source file
 }
 
 
 @pytest.mark.parametrize(
-    "copy_tuples, exists_side_effect, filecmp_side_effect, copyfile_call",
+    "copy_tuples, filecmp_side_effect, copyfile_call",
     conditional_copy_input.values(),
     ids=conditional_copy_input.keys(),
 )
-def test_conditional_copy(copy_tuples, exists_side_effect, filecmp_side_effect, copyfile_call):
+def test_conditional_copy(copy_tuples, filecmp_side_effect, copyfile_call):
     with (
-        patch("pathlib.Path.exists", side_effect=exists_side_effect),
         patch("filecmp.cmp", side_effect=filecmp_side_effect),
         patch("pathlib.Path.mkdir") as mock_mkdir,
         patch("shutil.copyfile") as mock_copyfile,
@@ -93,9 +85,37 @@ def test_conditional_copy(copy_tuples, exists_side_effect, filecmp_side_effect,
             mock_mkdir.assert_called_once()
             mock_copyfile.assert_called_once_with(*copyfile_call)
         else:
+            mock_mkdir.assert_not_called()
             mock_copyfile.assert_not_called()
 
 
+def test_conditional_copy_shared_parent():
+    """Files sharing a destination directory should only create the directory once"""
+    copy_tuples = [
+        (pathlib.Path("/path/to/source/dummy.file1"), pathlib.Path("/path/to/destination/dummy.file1")),
+        (pathlib.Path("/path/to/source/dummy.file2"), pathlib.Path("/path/to/destination/dummy.file2")),
+    ]
+    with (
+        patch("filecmp.cmp", side_effect=FileNotFoundError),
+        patch("pathlib.Path.mkdir") as mock_mkdir,
+        patch("shutil.copyfile") as mock_copyfile,
+    ):
+        _fetch.conditional_copy(copy_tuples)
+        mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        assert mock_copyfile.call_count == 2
+
+
+def test_conditional_copy_exception():
+    """Exceptions raised by the copy worker threads must propagate to the caller"""
+    with (
+        patch("filecmp.cmp", side_effect=FileNotFoundError),
+        patch("pathlib.Path.mkdir"),
+        patch("shutil.copyfile", side_effect=OSError("dummy")),
+        pytest.raises(OSError),
+    ):
+        _fetch.conditional_copy(one_file_copy_tuples)
+
+
 available_files_input = {
     "one file, str": ("/path/to/source", "dummy.file1", [True], [False], [], one_file_source_tree, [], None),
     "one file, list": ("/path/to/source", ["dummy.file1"], [True], [False], [], one_file_source_tree, [], None),
@@ -6,6 +6,7 @@
 """
 
 import sys
+import shutil
 from unittest.mock import patch, mock_open
 from contextlib import nullcontext as does_not_raise
 
@@ -241,7 +242,7 @@ def test_return_genfromtxt(
     :param outcome: either contextlib.nullcontext or pytest.raises() depending on expected success or exception,
         respectively
     """
-    with patch("builtins.open"), patch("numpy.genfromtxt", return_value=expected) as mock_genfromtxt, outcome:
+    with patch("builtins.open"), patch("numpy.loadtxt", return_value=expected) as mock_loadtxt, outcome:
         try:
             coordinates = _mixed_utilities.return_genfromtxt(
                 file_name,
@@ -257,7 +258,7 @@ def test_return_genfromtxt(
     # TODO: Figure out how to check against pytest.raises() instead.
     if not isinstance(outcome, does_not_raise):
         outcome = pytest.raises(SystemExit)
-    with patch("builtins.open"), patch("numpy.genfromtxt", return_value=expected) as mock_genfromtxt, outcome:
+    with patch("builtins.open"), patch("numpy.loadtxt", return_value=expected) as mock_loadtxt, outcome:
         try:
             coordinates = _mixed_utilities.return_genfromtxt_or_exit(
                 file_name,
@@ -271,6 +272,23 @@ def test_return_genfromtxt(
             pass
 
 
+def test_return_genfromtxt_fallback():
+    """Test the :meth:`turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities.return_genfromtxt` fallback to
+    ``numpy.genfromtxt`` when ``numpy.loadtxt`` can not parse the file"""
+    expected = numpy.array([[0, 0], [1, numpy.nan]])
+    with (
+        patch("builtins.open"),
+        patch("numpy.loadtxt", side_effect=ValueError) as mock_loadtxt,
+        patch("numpy.genfromtxt", return_value=expected) as mock_genfromtxt,
+    ):
+        coordinates = _mixed_utilities.return_genfromtxt("dummy", delimiter=",", header_lines=1)
+        mock_loadtxt.assert_called_once()
+        assert mock_loadtxt.call_args.kwargs == {"delimiter": ",", "skiprows": 1}
+        mock_genfromtxt.assert_called_once()
+        assert mock_genfromtxt.call_args.kwargs == {"delimiter": ",", "skip_header": 1}
+        assert numpy.allclose(coordinates, expected, equal_nan=True)
+
+
 remove_duplicate_items = {
     "no duplicates": (["thing1", "thing2"], ["thing1", "thing2"]),
     "one duplicate": (["thing1", "thing2", "thing1"], ["thing1", "thing2"]),
@@ -309,6 +327,83 @@ def test_intersection_of_lists(requested, available, expected):
     assert intersection == expected
 
 
+clone_file = {
+    "not linux": ("win32", None, False, 0),
+    "clone": ("linux", None, True, 1),
+    "unsupported file system": ("linux", OSError, False, 1),
+}
+
+
+@pytest.mark.parametrize(
+    "platform, ioctl_side_effect, expected, ioctl_calls",
+    clone_file.values(),
+    ids=clone_file.keys(),
+)
+def test_clone_file(platform, ioctl_side_effect, expected, ioctl_calls):
+    pytest.importorskip("fcntl", reason="Clone test requires a platform with fcntl")
+    with (
+        patch("sys.platform", platform),
+        patch("builtins.open", mock_open()),
+        patch("fcntl.ioctl", side_effect=ioctl_side_effect) as mock_ioctl,
+    ):
+        success = _mixed_utilities._clone_file("source", "destination")
+    assert success is expected
+    assert mock_ioctl.call_count == ioctl_calls
+
+
+copyfile = {
+    "clone": (True, 0),
+    "byte copy": (False, 1),
+}
+
+
+@pytest.mark.parametrize(
+    "clone_success, copyfile_calls",
+    copyfile.values(),
+    ids=copyfile.keys(),
+)
+def test_copyfile(clone_success, copyfile_calls):
+    with (
+        patch(
+            "turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities._clone_file",
+            return_value=clone_success,
+        ),
+        patch("shutil.copyfile") as mock_copyfile,
+    ):
+        _mixed_utilities.copyfile("source", "destination")
+    assert mock_copyfile.call_count == copyfile_calls
+
+
+def test_copyfile_same_file(tmp_path):
+    source = tmp_path / "source.cae"
+    source.write_bytes(b"turbo-turtle")
+    with (
+        patch("turbo_turtle._abaqus_python.turbo_turtle_abaqus._mixed_utilities._clone_file") as mock_clone,
+        pytest.raises(shutil.SameFileError),
+    ):
+        _mixed_utilities.copyfile(str(source), str(source))
+    mock_clone.assert_not_called()
+    assert source.read_bytes() == b"turbo-turtle"
+
+
+float_list = {
+    "comma separated": ("0.0, 1.0, 2.0", [0.0, 1.0, 2.0]),
+    "list": ("[0.0, 1.0, 2.0]", [0.0, 1.0, 2.0]),
+    "tuple": ("(0, 1, 2)", [0.0, 1.0, 2.0]),
+    "whitespace": (" 0.0,1.0 , 2.0 ", [0.0, 1.0, 2.0]),
+}
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    float_list.values(),
+    ids=float_list.keys(),
+)
+def test_float_list(string, expected):
+    floats = _mixed_utilities.float_list(string)
+    assert floats == expected
+
+
 element_type_regex = {
     "C3D8-C3D8R": (
         "*element, type=C3D8\n*ELEMENT, TYPE=C3D8\n*Element, Type=C3D8\n",
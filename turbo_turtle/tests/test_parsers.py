@@ -65,6 +65,31 @@ def test_construct_prog(basename, expected_prog):
     assert prog == expected_prog
 
 
+part_name_help = {
+    "abaqus": ({"cubit": False}, "Part name (default: %(default)s)"),
+    "abaqus plural": ({"cubit": False, "plural": True}, "Part name(s) (default: %(default)s)"),
+    "cubit": (
+        {"cubit": True},
+        "Part name or Cubit volume name. Cubit implementation converts hyphens to underscores for "
+        "ACIS compatibility. (default: %(default)s)",
+    ),
+    "cubit plural": (
+        {"cubit": True, "plural": True},
+        "Part name(s) or Cubit volume name(s). Cubit implementation converts hyphens to underscores for "
+        "ACIS compatibility. (default: %(default)s)",
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_help",
+    part_name_help.values(),
+    ids=part_name_help.keys(),
+)
+def test_part_name_help(kwargs, expected_help):
+    assert parsers._part_name_help(**kwargs) == expected_help
+
+
 subcommand_parser = {
     "geometry": ("geometry", ["--input-file", "input_file", "--output-file", "output_file"], []),
     "cylinder": (
@@ -167,15 +167,15 @@ def setup_sets_commands(
     part_name = " ".join(csv.stem for csv in input_file)
     commands = setup_geometry_commands(model, input_file, revolution_angle, 0.0, backend).values[0]
     if face_sets is not None:
-        face_sets = _utilities.construct_append_options("--face-set", face_sets)
+        face_sets = " ".join(_utilities.construct_append_arguments("--face-set", face_sets))
     else:
         face_sets = ""
     if edge_sets is not None:
-        edge_sets = _utilities.construct_append_options("--edge-set", edge_sets)
+        edge_sets = " ".join(_utilities.construct_append_arguments("--edge-set", edge_sets))
     else:
         edge_sets = ""
     if edge_seeds is not None:
-        edge_seeds = _utilities.construct_append_options("--edge-seed", edge_seeds)
+        edge_seeds = " ".join(_utilities.construct_append_arguments("--edge-seed", edge_seeds))
     else:
         edge_seeds = ""
     backend_option = f"--backend {backend}" if backend is not None else ""
@@ -313,6 +313,7 @@ system_tests = (
     ("axisymmetric.cae",             1., 2.,     0.,       0.,   "both",       "CAX4",             "CAX4R", "abaqus", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("quarter-sphere.cae",           1., 2.,    90.,       0.,   "both",       "C3D8",             "C3D8R", "abaqus", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("offset-sphere.cae",            1., 2.,   360.,       1.,   "both",       "C3D8",             "C3D8R", "abaqus", "abaqus"),  # fmt: skip # noqa: E241,E501
+    ("offset-solid-sphere.cae",      0., 2.,   360.,       1.,   "both",       "C3D8",             "C3D8R", "abaqus", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("eigth-sphere.cae",             1., 2.,    90.,       0.,  "upper",       "C3D8",             "C3D8R", "abaqus", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("half-sphere.cae",              1., 2.,   360.,       0.,  "upper",       "C3D8",             "C3D8R", "abaqus", "abaqus"),  # fmt: skip # noqa: E241,E501
     # Cubit: for Abaqus INP
@@ -321,6 +322,7 @@ system_tests = (
     ("axisymmetric.cae",             1., 2.,     0.,       0.,   "both",         None,             "CAX4R",  "cubit", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("quarter-sphere.cae",           1., 2.,    90.,       0.,   "both",         None,             "C3D8R",  "cubit", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("offset-sphere.cae",            1., 2.,   360.,       1.,   "both",         None,             "C3D8R",  "cubit", "abaqus"),  # fmt: skip # noqa: E241,E501
+    ("offset-solid-sphere.cae",      0., 2.,   360.,       1.,   "both",         None,             "C3D8R",  "cubit", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("eigth-sphere.cae",             1., 2.,    90.,       0.,  "upper",         None,             "C3D8R",  "cubit", "abaqus"),  # fmt: skip # noqa: E241,E501
     ("half-sphere.cae",              1., 2.,   360.,       0.,  "upper",         None,             "C3D8R",  "cubit", "abaqus"),  # fmt: skip # noqa: E241,E501
     # Cubit "element type" is really a "meshing scheme"
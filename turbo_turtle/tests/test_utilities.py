@@ -60,6 +60,14 @@ def test_run_command():
     ):
         _utilities.run_command("dummy")
 
+    with patch("subprocess.check_output") as mock_check_output:
+        _utilities.run_command("dummy --option 'quoted value'")
+    mock_check_output.assert_called_once_with(["dummy", "--option", "quoted value"])
+
+    with patch("subprocess.check_output") as mock_check_output:
+        _utilities.run_command(["dummy", "--option", "unquoted value"])
+    mock_check_output.assert_called_once_with(["dummy", "--option", "unquoted value"])
+
 
 def test_cubit_os_bin():
     with patch("platform.system", return_value="Darwin"):
@@ -92,38 +100,43 @@ def test_import_cubit():
         cubit = _utilities.import_cubit()
 
 
-construct_append_options = {
+construct_append_arguments = {
     "strings": (
         "--option-name",
         [["row1_column1", "row1_column2"], ["row2_column1", "row2_column2"]],
-        "--option-name row1_column1 row1_column2 --option-name row2_column1 row2_column2",
+        ["--option-name", "row1_column1", "row1_column2", "--option-name", "row2_column1", "row2_column2"],
     ),
     "strings: one row": (
         "--option-name",
         [["row1_column1", "row1_column2"]],
-        "--option-name row1_column1 row1_column2",
+        ["--option-name", "row1_column1", "row1_column2"],
+    ),
+    "strings: whitespace": (
+        "--face-set",
+        [["name", "[#1 ]"]],
+        ["--face-set", "name", "[#1 ]"],
     ),
     "ints": (
         "--int-tuple",
-        [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
-        "--int-tuple 1 2 3 --int-tuple 4 5 6 --int-tuple 7 8 9",
+        [[1, 2, 3], [4, 5, 6]],
+        ["--int-tuple", "1", "2", "3", "--int-tuple", "4", "5", "6"],
     ),
     "empty array": (
         "--empty",
         [[]],
-        "",
+        [],
     ),
 }
 
 
 @pytest.mark.parametrize(
     "option, array, expected",
-    construct_append_options.values(),
-    ids=construct_append_options.keys(),
+    construct_append_arguments.values(),
+    ids=construct_append_arguments.keys(),
 )
-def test_construct_append_options(option, array, expected):
-    option_string = _utilities.construct_append_options(option, array)
-    assert option_string == expected
+def test_construct_append_arguments(option, array, expected):
+    arguments = _utilities.construct_append_arguments(option, array)
+    assert arguments == expected
 
 
 character_delimited_list = {
@@ -36,7 +36,7 @@ compare_xy_values = {
                          ids=compare_xy_values.keys(),)
 def test_compare_xy_values(coordinates, expected, rtol, atol):
     bools = vertices._compare_xy_values(coordinates, rtol=rtol, atol=atol)
-    assert bools == expected
+    assert numpy.array_equal(bools, expected)
 
 
 compare_euclidean_distance = {
@@ -49,6 +49,9 @@ compare_euclidean_distance = {
     "equal": (
         numpy.array([[0, 0], [1, 0]]), 1.0, [False, False]
     ),
+    "negative": (
+        numpy.array([[0, 0], [0.5, 0], [0.5, 0]]), -1.0, [False, True, True]
+    ),
 }
 
 
@@ -57,44 +60,7 @@ compare_euclidean_distance = {
                          ids=compare_euclidean_distance.keys(),)
 def test_compare_euclidean_distance(coordinates, euclidean_distance, expected):
     bools = vertices._compare_euclidean_distance(coordinates, euclidean_distance)
-    assert bools == expected
-
-
-bool_via_or = {
-    "all true vs all false": (
-        [True, True],
-        [False, False],
-        [True, True]
-    ),
-    "all false": (
-        [False, False],
-        [False, False],
-        [False, False],
-    ),
-    "all true": (
-        [True, True],
-        [True, True],
-        [True, True],
-    ),
-    "true/false mirror": (
-        [True, False],
-        [False, True],
-        [True, True]
-    ),
-    "true/false mirror 2": (
-        [False, True],
-        [True, False],
-        [True, True]
-    ),
-}
-
-
-@pytest.mark.parametrize("bool_list_1, bool_list_2, expected",
-                         bool_via_or.values(),
-                         ids=bool_via_or.keys(),)
-def test_bool_via_or(bool_list_1, bool_list_2, expected):
-    bools = vertices._bool_via_or(bool_list_1, bool_list_2)
-    assert bools == expected
+    assert numpy.array_equal(bools, expected)
 
 
 break_coordinates = {
@@ -254,6 +220,23 @@ def test_scale_and_offset_coordinates(coordinates, unit_conversion, y_offset, ex
     assert numpy.allclose(new_coordinates, expected)
 
 
+def test_scale_and_offset_coordinates_no_copy():
+    """Default unit conversion and y offset should not copy the coordinates"""
+    coordinates = numpy.array([[0., 0.], [1., 1.]])
+    new_coordinates = vertices.scale_and_offset_coordinates(coordinates)
+    assert new_coordinates is coordinates
+
+
+@pytest.mark.parametrize("unit_conversion, y_offset", [(1, 0), (2, 1)], ids=["no modifications", "both"])
+def test_scale_and_offset_coordinates_integer_input(unit_conversion, y_offset):
+    """Integer coordinates should always return a new float array"""
+    coordinates = numpy.array([[0, 0], [1, 1]])
+    new_coordinates = vertices.scale_and_offset_coordinates(coordinates, unit_conversion, y_offset)
+    assert new_coordinates.dtype == float
+    assert new_coordinates is not coordinates
+    assert numpy.allclose(new_coordinates, coordinates * unit_conversion + [0, y_offset])
+
+
 the_real_mccoy = {
     "washer": (
         numpy.array([[1.0, -0.5], [2.0, -0.5], [2.0, 0.5], [1.0, 0.5]]),
@@ -314,7 +297,18 @@ the_real_mccoy = {
                ]
             )
         ]
-    )
+    ),
+    "two point arrays": (
+        numpy.array([[0.0, 0.0], [1.0, 1.0], [5.0, 5.0], [6.0, 6.5]]),
+        2,
+        [
+            numpy.array([[1.0, 1.0], [5.0, 5.0]]),
+            numpy.array([[6.0, 6.5], [0.0, 0.0]]),
+            numpy.array([[0.0, 0.0], [1.0, 1.0]]),
+            numpy.array([[5.0, 5.0], [6.0, 6.5]]),
+        ],
+        []
+    ),
 }
 
 
@@ -419,8 +413,7 @@ def test_break_coordinates_passthrough():
     with (
         patch("turbo_turtle._abaqus_python.turbo_turtle_abaqus.vertices._compare_xy_values") as mock_xy_values,
         patch("turbo_turtle._abaqus_python.turbo_turtle_abaqus.vertices._compare_euclidean_distance"),
-        patch("turbo_turtle._abaqus_python.turbo_turtle_abaqus.vertices._bool_via_or"),
-        patch("numpy.where"),
+        patch("numpy.flatnonzero"),
         patch("numpy.split"),
     ):
         all_splines = vertices._break_coordinates([], 4.0, rtol=1e-5, atol=1e-9)
@@ -484,6 +477,48 @@ def test_cylinder_lines(inner_radius, outer_radius, height, y_offset, expected):
         assert numpy.allclose(line, expected_line)
 
 
+is_solid_sphere = {
+    "zero radius": ((0., 0.), 0., 1., "both", True),
+    "zero radius, offset center": ((0., 1.e4), 0., 1., "both", True),
+    # The inner arc end points are within numpy.allclose relative tolerance of a far offset center
+    "small radius, offset center": ((0., 1.e4), 1.e-3, 1., "both", False),
+    "at tolerance": ((0., 0.), 1.e-8, 1., "upper", True),
+    "above tolerance": ((0., 0.), 2.e-8, 1., "upper", False),
+    "negative radius": ((0., 0.), -0.5, 1., "lower", False),
+    "hollow": ((0., 1.), 0.5, 1., "both", False),
+}
+
+
+@pytest.mark.parametrize("center, inner_radius, outer_radius, quadrant, expected",
+                         is_solid_sphere.values(),
+                         ids=is_solid_sphere.keys(),)
+def test_is_solid_sphere(center, inner_radius, outer_radius, quadrant, expected):
+    """Test :meth:`turbo_turtle._abaqus_python.turbo_turtle_abaqus.vertices.is_solid_sphere`"""
+    assert vertices.is_solid_sphere(inner_radius) == expected
+    # Solid spheres must have inner arc end points on the center, within the absolute tolerance
+    inner_points = vertices.sphere(center, inner_radius, outer_radius, quadrant)[0:2]
+    on_center = numpy.allclose(inner_points, center, rtol=0., atol=1.e-8)
+    assert on_center == expected
+
+
+is_axisymmetric = {
+    "zero": (0., True),
+    "at tolerance": (1.e-8, True),
+    "negative at tolerance": (-1.e-8, True),
+    "above tolerance": (2.e-8, False),
+    "three dimensional": (360., False),
+}
+
+
+@pytest.mark.parametrize("revolution_angle, expected",
+                         is_axisymmetric.values(),
+                         ids=is_axisymmetric.keys(),)
+def test_is_axisymmetric(revolution_angle, expected):
+    """Test :meth:`turbo_turtle._abaqus_python.turbo_turtle_abaqus.vertices.is_axisymmetric`"""
+    assert vertices.is_axisymmetric(revolution_angle) == expected
+    assert vertices.is_axisymmetric(revolution_angle) == numpy.isclose(revolution_angle, 0.)
+
+
 number = math.sqrt(2.**2 / 2.)
 rectalinear_coordinates = {
     "unit circle": (
@@ -536,6 +571,26 @@ def test_normalize_vector(vector, expected):
     assert numpy.allclose(normalized, expected)
 
 
+normalize_rows = {
+    "axes": (
+        numpy.array([[2., 0., 0.], [0., 3., 0.], [0., 0., 0.5]]),
+        numpy.array([[1., 0., 0.], [0., 1., 0.], [0., 0., 1.]])
+    ),
+    "unit equal": (
+        numpy.array([[1., 1., 1.], [2., 2., 2.]]),
+        numpy.array([[one_over_root_three, one_over_root_three, one_over_root_three]] * 2)
+    ),
+}
+
+
+@pytest.mark.parametrize("vectors, expected",
+                         normalize_rows.values(),
+                         ids=normalize_rows.keys(),)
+def test_normalize_rows(vectors, expected):
+    normalized = vertices._normalize_rows(vectors)
+    assert numpy.allclose(normalized, expected)
+
+
 midpoint_vector = {
     "+x+y": (
         [1., 0, 0], [0, 1., 0], numpy.array([0.5, 0.5, 0.])
@@ -594,6 +649,9 @@ any_parallel = {
     "multiple": (
         (0., 1., 0.), [(2., 0., 0.), (0., 2., 0.)], True
     ),
+    "empty options": (
+        (0., 1., 0.), [], False
+    ),
 }
 
 
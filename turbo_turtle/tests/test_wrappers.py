@@ -330,11 +330,12 @@ def test_abaqus_wrappers(subcommand, namespace, expected_options, unexpected_opt
         subcommand_wrapper = getattr(_abaqus_wrappers, subcommand)
         subcommand_wrapper(args, command)
     mock_run.assert_called_once()
-    command_string = mock_run.call_args[0][0]
+    command_list = mock_run.call_args[0][0]
+    assert all(isinstance(argument, str) for argument in command_list)
     for option in expected_options:
-        assert option in command_string
+        assert option in command_list
     for option in unexpected_options:
-        assert option not in command_string
+        assert option not in command_list
 
 
 def trim_namespace(original, pop_keys):